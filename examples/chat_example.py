@@ -3,7 +3,12 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import os
+import queue
+import sys
+import threading
+import time
 
 from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
 
@@ -12,17 +17,98 @@ from langchain_parallel_web import ChatParallelWeb
 # Set your API key: export PARALLEL_API_KEY="your-api-key"
 
 
-def basic_example() -> None:
-    """Basic synchronous chat example."""
-    print("=== Basic Chat Example ===")
+@functools.cache
+def _get_chat() -> ChatParallelWeb:
+    """Return the chat model shared by every example.
 
-    # Initialize the chat model
-    chat = ChatParallelWeb(
+    Building it once means validation and the underlying OpenAI client, with
+    its connection pool, are set up a single time. It is created on first use,
+    after ``main`` has checked that the API key is set.
+    """
+    return ChatParallelWeb(
         model_name="speed",  # Parallel's chat model
         temperature=0.7,  # Optional: temperature (ignored by Parallel)
         max_tokens=None,  # Optional: max tokens (ignored by Parallel)
     )
 
+
+_FLUSH_INTERVAL = 0.05  # seconds
+_FLUSH_BYTES = 1024
+
+
+class _OutputBuffer:
+    """Batch streamed text and write it to stdout every 50 ms or 1 KB.
+
+    Shared by the thread and asyncio printers, which only differ in how they
+    wait for the next chunk.
+    """
+
+    def __init__(self) -> None:
+        self._pending: list[str] = []
+        self._size = 0
+        self._deadline = time.monotonic() + _FLUSH_INTERVAL
+
+    def wait_time(self) -> float:
+        """Seconds to wait for more text before the next timed flush."""
+        return max(self._deadline - time.monotonic(), 0)
+
+    def add(self, text: str) -> None:
+        """Buffer ``text``, writing the batch out once a flush is due."""
+        self._pending.append(text)
+        self._size += len(text)
+        if self._size >= _FLUSH_BYTES or time.monotonic() >= self._deadline:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write and flush any buffered text."""
+        if self._pending:
+            sys.stdout.write("".join(self._pending))
+            sys.stdout.flush()
+            self._pending.clear()
+        self._size = 0
+        self._deadline = time.monotonic() + _FLUSH_INTERVAL
+
+
+def _printer(chunks: queue.Queue[str | None]) -> None:
+    """Drain streamed text from a queue and print it in batches.
+
+    Runs on its own thread so terminal writes never hold up the network reads
+    feeding the queue. Output is flushed every 50 ms or 1 KB, whichever comes
+    first, until a ``None`` sentinel arrives.
+    """
+    output = _OutputBuffer()
+    while True:
+        try:
+            text = chunks.get(timeout=output.wait_time())
+        except queue.Empty:
+            text = ""
+        if text is None:
+            break
+        output.add(text)
+    output.flush()
+
+
+async def _aprinter(chunks: asyncio.Queue[str | None]) -> None:
+    """Async counterpart of ``_printer`` that runs as a task on the loop."""
+    output = _OutputBuffer()
+    while True:
+        try:
+            text = await asyncio.wait_for(chunks.get(), timeout=output.wait_time())
+        except asyncio.TimeoutError:
+            text = ""
+        if text is None:
+            break
+        output.add(text)
+    output.flush()
+
+
+def basic_example() -> None:
+    """Basic synchronous chat example."""
+    print("=== Basic Chat Example ===")
+
+    # Get the shared chat model
+    chat = _get_chat()
+
     # Create messages
     messages = [
         SystemMessage(
@@ -57,7 +143,7 @@ def streaming_example() -> None:
     """Streaming example for real-time responses."""
     print("\n=== Streaming Chat Example ===")
 
-    chat = ChatParallelWeb()
+    chat = _get_chat()
 
     messages = [
         SystemMessage(content="You are a creative writing assistant."),
@@ -66,13 +152,21 @@ def streaming_example() -> None:
 
     print("Streaming response:")
     try:
-        full_response = ""
-        for chunk in chat.stream(messages):
-            if chunk.content:
-                content_str = str(chunk.content) if chunk.content else ""
-                print(content_str, end="", flush=True)
-                full_response += content_str
-
+        # Hand chunks to a printer thread so stdout never blocks the stream
+        chunks: queue.Queue[str | None] = queue.Queue(maxsize=256)
+        printer = threading.Thread(target=_printer, args=(chunks,), daemon=True)
+        printer.start()
+        parts = []
+        try:
+            for chunk in chat.stream(messages):
+                if chunk.content:
+                    parts.append(str(chunk.content))
+                    chunks.put(parts[-1])
+        finally:
+            chunks.put(None)
+            printer.join()
+
+        full_response = "".join(parts)
         print(f"\nTotal response length: {len(full_response)} characters")
 
     except ValueError as e:
@@ -86,7 +180,7 @@ async def async_example() -> None:
     """Asynchronous example."""
     print("\n=== Async Chat Example ===")
 
-    chat = ChatParallelWeb()
+    chat = _get_chat()
 
     messages = [
         SystemMessage(content="You are a technology expert."),
@@ -100,14 +194,20 @@ async def async_example() -> None:
 
         # Async streaming
         print("\nAsync streaming:")
-        async for chunk in chat.astream(
-            [
-                SystemMessage(content="You are a helpful assistant."),
-                HumanMessage(content="Count from 1 to 5."),
-            ]
-        ):
-            if chunk.content:
-                print(chunk.content, end="", flush=True)
+        async_chunks: asyncio.Queue[str | None] = asyncio.Queue(maxsize=256)
+        printer_task = asyncio.create_task(_aprinter(async_chunks))
+        try:
+            async for chunk in chat.astream(
+                [
+                    SystemMessage(content="You are a helpful assistant."),
+                    HumanMessage(content="Count from 1 to 5."),
+                ]
+            ):
+                if chunk.content:
+                    await async_chunks.put(str(chunk.content))
+        finally:
+            await async_chunks.put(None)
+            await printer_task
         print("\nAsync streaming completed")
 
     except ValueError as e:
@@ -121,7 +221,7 @@ def conversation_example() -> None:
     """Example of maintaining conversation context."""
     print("\n=== Conversation Example ===")
 
-    chat = ChatParallelWeb()
+    chat = _get_chat()
 
     # Start with system message
     messages: list[BaseMessage] = [
@@ -160,8 +260,8 @@ def conversation_example() -> None:
             print(f"Error: {e}")
 
 
-def main() -> None:
-    """Run all examples."""
+async def main() -> None:
+    """Run all examples on a single event loop."""
     print("=== Parallel Chat Examples ===")
 
     # Check if API key is set
@@ -172,12 +272,13 @@ def main() -> None:
 
     print("API key found in environment")
 
-    # Run examples
+    # Run examples. Sync examples run in a worker thread so the whole script
+    # shares one event loop instead of creating one per async example.
     try:
-        basic_example()
-        streaming_example()
-        asyncio.run(async_example())
-        conversation_example()
+        await asyncio.to_thread(basic_example)
+        await asyncio.to_thread(streaming_example)
+        await async_example()
+        await asyncio.to_thread(conversation_example)
 
         print("\n=== All examples completed successfully ===")
     except Exception as e:
@@ -186,4 +287,4 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
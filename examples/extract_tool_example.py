@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import os
 
 from langchain_parallel_web import ParallelExtractTool
@@ -10,12 +11,22 @@ from langchain_parallel_web import ParallelExtractTool
 # Set your API key: export PARALLEL_API_KEY="your-api-key"
 
 
+@functools.cache
+def _get_extract_tool() -> ParallelExtractTool:
+    """Return the default extract tool shared by the examples.
+
+    It is created on first use, after ``main`` has checked that the API key is
+    set. Examples that demonstrate custom settings build their own tool.
+    """
+    return ParallelExtractTool()
+
+
 def basic_extract_examples() -> None:
     """Basic extract tool examples."""
     print("=== Basic Extract Tool Examples ===")
 
     # Initialize the extract tool
-    tool = ParallelExtractTool()
+    tool = _get_extract_tool()
 
     # Example 1: Extract from a single URL
     print("\nExample 1: Extract from a single URL")
@@ -34,7 +45,7 @@ def batch_extract_examples() -> None:
     """Batch extraction examples."""
     print("\n=== Batch Extract Examples ===")
 
-    tool = ParallelExtractTool()
+    tool = _get_extract_tool()
 
     # Example 2: Extract from multiple URLs
     print("\nExample 2: Extract from multiple URLs")
@@ -59,7 +70,7 @@ def focused_extraction_examples() -> None:
     """Examples with search objective and queries."""
     print("\n=== Focused Extraction Examples ===")
 
-    tool = ParallelExtractTool()
+    tool = _get_extract_tool()
 
     # Example 3: Extract with search objective
     print("\nExample 3: Extract with search objective")
@@ -118,7 +129,7 @@ def error_handling_examples() -> None:
     """Examples with error handling."""
     print("\n=== Error Handling Examples ===")
 
-    tool = ParallelExtractTool()
+    tool = _get_extract_tool()
 
     # Example 4: Handle mixed valid/invalid URLs
     print("\nExample 4: Extract with error handling")
@@ -145,7 +156,7 @@ async def async_extract_examples() -> None:
     """Async extraction examples."""
     print("\n=== Async Extract Examples ===")
 
-    tool = ParallelExtractTool()
+    tool = _get_extract_tool()
 
     # Example 5: Async extraction
     print("\nExample 5: Async extraction")
@@ -183,25 +194,28 @@ def agent_integration_example() -> None:
 
     result = extract_tool.invoke({"urls": urls})
 
-    # Prepare context for the chat model
+    # Prepare context for the chat model, joining a generator so no
+    # intermediate list of per-document strings is built. Sorting by URL keeps
+    # the context identical across runs regardless of result order.
     context = "\n\n".join(
-        [
-            f"Source: {doc['title']} ({doc['url']})\n{doc['content'][:1000]}..."
-            for doc in result
-        ]
+        f"Source: {doc['title']} ({doc['url']})\n{doc['content'][:1000]}..."
+        for doc in sorted(result, key=lambda doc: doc["url"] or "")
     )
 
     # Generate summary using extracted content
     print("\nGenerating summary with extracted context...")
     from langchain_core.messages import HumanMessage, SystemMessage
 
+    # Order messages from most to least stable: the fixed instruction, then
+    # the extracted context, then the question. Keeping the question last
+    # lets the provider reuse its prompt cache for the shared prefix. The
+    # consecutive human messages are merged into one user turn, context first.
     messages = [
         SystemMessage(content="You are a helpful assistant that summarizes content."),
+        HumanMessage(content=f"<context>\n{context}\n</context>"),
         HumanMessage(
-            content=(
-                f"Summarize the key differences between AGI and AI "
-                f"based on this content:\n\n{context}"
-            )
+            content="Summarize the key differences between AGI and AI "
+            "based on the content above."
         ),
     ]
 
@@ -209,7 +223,7 @@ def agent_integration_example() -> None:
     print(f"\nSummary: {response.content}")
 
 
-def main() -> None:
+async def main() -> None:
     """Main function demonstrating Parallel Extract Tool usage."""
     print("=== Parallel Extract Tool Examples ===")
 
@@ -222,28 +236,29 @@ def main() -> None:
     print("API key found in environment")
     print("Starting extract tool examples...")
 
-    # Run examples
+    # Run examples. Sync examples run in a worker thread so the whole script
+    # shares one event loop instead of creating one per async example.
     try:
         # Basic examples
-        basic_extract_examples()
+        await asyncio.to_thread(basic_extract_examples)
 
         # Batch extraction
-        batch_extract_examples()
+        await asyncio.to_thread(batch_extract_examples)
 
         # Focused extraction
-        focused_extraction_examples()
+        await asyncio.to_thread(focused_extraction_examples)
 
         # Content length control
-        content_length_control_examples()
+        await asyncio.to_thread(content_length_control_examples)
 
         # Error handling
-        error_handling_examples()
+        await asyncio.to_thread(error_handling_examples)
 
         # Async extraction
-        asyncio.run(async_extract_examples())
+        await async_extract_examples()
 
         # Agent integration
-        agent_integration_example()
+        await asyncio.to_thread(agent_integration_example)
 
         print("\n=== All examples completed successfully ===")
         print("\nKey features demonstrated:")
@@ -266,4 +281,4 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
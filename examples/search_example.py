@@ -1,9 +1,20 @@
-"""Examples of Parallel Search integration."""
+"""Examples of Parallel Search integration.
+
+Independent searches should not wait on each other. Async code can use
+``asyncio.gather`` over ``ainvoke``; sync code gets the same effect by mapping
+``invoke`` over a ``ThreadPoolExecutor``. Both tool calls share one client and
+its connection pool, so the threads reuse connections instead of opening new
+ones.
+"""
 
 from __future__ import annotations
 
 import asyncio
+import functools
 import os
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from typing import Any
 
 from langchain_parallel_web import ParallelWebSearchTool
@@ -11,41 +22,49 @@ from langchain_parallel_web import ParallelWebSearchTool
 # Set your API key: export PARALLEL_API_KEY="your-api-key"
 
 
+@functools.cache
+def _get_search_tool() -> ParallelWebSearchTool:
+    """Return the search tool shared by every example.
+
+    It is created on first use, after ``main`` has checked that the API key is
+    set, and every example reuses its clients and connection pool.
+    """
+    return ParallelWebSearchTool()
+
+
 def basic_search_examples() -> None:
     """Basic search tool examples."""
     print("=== Basic Search Examples ===")
 
-    # Initialize the search tool
-    search_tool = ParallelWebSearchTool()
+    # Get the shared search tool
+    search_tool = _get_search_tool()
+
+    # Examples 1 and 2 are independent, so they run in parallel threads
+    params1 = {
+        "objective": (
+            "What are the latest developments in artificial intelligence in 2024?"
+        )
+    }
+    params2 = {
+        "search_queries": [
+            "AI developments 2024",
+            "latest artificial intelligence news",
+            "machine learning breakthroughs 2024",
+        ],
+        "max_results": 8,
+        "include_metadata": True,  # Get timing info
+    }
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        result, result2 = executor.map(search_tool.invoke, [params1, params2])
 
     # Example 1: Simple objective-based search
     print("\nExample 1: Simple objective-based search")
-    result = search_tool.invoke(
-        {
-            "objective": (
-                "What are the latest developments in artificial intelligence in 2024?"
-            )
-        }
-    )
-
     print(f"Found {len(result.get('results', []))} results")
     display_results(result, max_results=2)
     display_metadata(result)
 
     # Example 2: Multiple search queries
     print("\nExample 2: Multiple search queries")
-    result2 = search_tool.invoke(
-        {
-            "search_queries": [
-                "AI developments 2024",
-                "latest artificial intelligence news",
-                "machine learning breakthroughs 2024",
-            ],
-            "max_results": 8,
-            "include_metadata": True,  # Get timing info
-        }
-    )
-
     print(f"Found {len(result2.get('results', []))} results")
     display_results(result2, max_results=3)
     display_metadata(result2)
@@ -55,47 +74,45 @@ def search_examples() -> None:
     """Search features examples."""
     print("\n=== Search Examples ===")
 
-    search_tool = ParallelWebSearchTool()
+    search_tool = _get_search_tool()
+
+    # Examples 3 and 4 are independent, so they run in parallel threads
+    params3 = {
+        "objective": "Latest climate change research and findings",
+        "source_policy": {
+            "include_domains": ["nature.com", "science.org", "arxiv.org"],
+            "exclude_domains": ["reddit.com", "twitter.com", "facebook.com"],
+        },
+        "max_results": 5,
+        "excerpts": {"max_chars_per_result": 2000},  # Longer excerpts
+        "mode": "one-shot",  # Comprehensive results
+        "fetch_policy": {
+            "max_age_seconds": 86400,  # Cache content for 1 day
+            "timeout_seconds": 60,  # 60 second timeout for live fetches
+        },
+        "include_metadata": True,
+    }
+    params4 = {
+        "search_queries": [
+            "tech industry layoffs 2024",
+            "startup funding trends",
+            "AI company acquisitions",
+        ],
+        "max_results": 6,
+        "mode": "agentic",  # Token-efficient, concise results
+        "include_metadata": True,
+    }
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        result3, result4 = executor.map(search_tool.invoke, [params3, params4])
 
     # Example 3: Academic search with domain filtering and fetch policy
     print("\nExample 3: Academic search with domain filtering and fetch policy")
-    result3 = search_tool.invoke(
-        {
-            "objective": "Latest climate change research and findings",
-            "source_policy": {
-                "include_domains": ["nature.com", "science.org", "arxiv.org"],
-                "exclude_domains": ["reddit.com", "twitter.com", "facebook.com"],
-            },
-            "max_results": 5,
-            "excerpts": {"max_chars_per_result": 2000},  # Longer excerpts
-            "mode": "one-shot",  # Comprehensive results
-            "fetch_policy": {
-                "max_age_seconds": 86400,  # Cache content for 1 day
-                "timeout_seconds": 60,  # 60 second timeout for live fetches
-            },
-            "include_metadata": True,
-        }
-    )
-
     print("Academic sources search completed")
     display_results(result3, max_results=2, show_excerpts=True)
     display_metadata(result3)
 
     # Example 4: Multiple topic news search with agentic mode
     print("\nExample 4: Multiple topic news search with agentic mode")
-    result4 = search_tool.invoke(
-        {
-            "search_queries": [
-                "tech industry layoffs 2024",
-                "startup funding trends",
-                "AI company acquisitions",
-            ],
-            "max_results": 6,
-            "mode": "agentic",  # Token-efficient, concise results
-            "include_metadata": True,
-        }
-    )
-
     print("Multiple query search completed")
     display_results(result4, max_results=3)
     display_metadata(result4)
@@ -105,7 +122,7 @@ async def async_search_examples() -> None:
     """Async search examples."""
     print("\n=== Async Search Examples ===")
 
-    search_tool = ParallelWebSearchTool()
+    search_tool = _get_search_tool()
 
     # Example 5: Async search
     print("\nExample 5: Async search execution")
@@ -140,27 +157,39 @@ async def async_search_examples() -> None:
         display_results(result, max_results=1)
 
 
+_MISSING = "N/A"
+_METADATA_DEFAULTS = {
+    "search_duration_seconds": _MISSING,
+    "actual_results_returned": _MISSING,
+    "max_results_requested": _MISSING,
+}
+_METADATA_TEMPLATE = (
+    "\n  Search Metadata:\n"
+    "    Duration: {search_duration_seconds}s\n"
+    "    Results: {actual_results_returned}/{max_results_requested}"
+)
+
+
 def display_results(
     result: dict[str, Any], *, max_results: int = 5, show_excerpts: bool = False
 ) -> None:
     """Display search results in a formatted way."""
-    if "results" not in result:
+    results = result.get("results")
+    if not results:
         print("No results found in response")
         print(f"Response keys: {list(result.keys())}")
         return
 
-    results = result["results"][:max_results]
-
-    for i, res in enumerate(results, 1):
+    for i, res in enumerate(islice(results, max_results), 1):
         print(f"\nResult {i}:")
-        print(f"  URL: {res.get('url', 'N/A')}")
-        print(f"  Title: {res.get('title', 'N/A')}")
+        print(f"  URL: {res.get('url', _MISSING)}")
+        print(f"  Title: {res.get('title', _MISSING)}")
 
-        excerpts = res.get("excerpts", [])
+        excerpts = res.get("excerpts")
         if excerpts:
             print(f"  Excerpts: {len(excerpts)} found")
             if show_excerpts:
-                for j, excerpt in enumerate(excerpts[:2], 1):
+                for j, excerpt in enumerate(islice(excerpts, 2), 1):
                     print(f"    {j}. {excerpt[:200]}...")
             else:
                 print(f"    First: {excerpts[0][:100]}...")
@@ -168,16 +197,12 @@ def display_results(
 
 def display_metadata(result: dict[str, Any]) -> None:
     """Display search metadata if available."""
-    if "search_metadata" not in result:
+    metadata = result.get("search_metadata")
+    if not metadata:
         return
 
-    metadata = result["search_metadata"]
-    print("\n  Search Metadata:")
-    print(f"    Duration: {metadata.get('search_duration_seconds', 'N/A')}s")
-    print(
-        f"    Results: {metadata.get('actual_results_returned', 'N/A')}"
-        f"/{metadata.get('max_results_requested', 'N/A')}"
-    )
+    # Fill the template in one pass, falling back to N/A for missing fields
+    print(_METADATA_TEMPLATE.format_map(ChainMap(metadata, _METADATA_DEFAULTS)))
 
     if metadata.get("query_count"):
         print(f"    Queries: {metadata['query_count']}")
@@ -189,76 +214,99 @@ def display_metadata(result: dict[str, Any]) -> None:
             print(f"    Excluded domains: {metadata['excluded_domains']}")
 
 
-def practical_use_cases() -> None:
-    """Practical use case examples."""
-    print("\n=== Practical Use Cases ===")
+def _use_case_queries() -> tuple[dict[str, Any], dict[str, Any], dict[str, Any]]:
+    """Search inputs for the research, news and competitor use cases."""
+    # Use case 1: Research assistance
+    research_query = {
+        "objective": "Analysis of renewable energy adoption trends in 2024",
+        "source_policy": {
+            "include_domains": ["iea.org", "irena.org", "energy.gov", "nature.com"],
+            "exclude_domains": ["blog.com", "personal-site.com"],
+        },
+        "max_results": 10,
+        "excerpts": {"max_chars_per_result": 2500},
+        "include_metadata": True,
+    }
 
-    search_tool = ParallelWebSearchTool()
+    # Use case 2: News monitoring
+    news_query = {
+        "search_queries": [
+            "tech industry news today",
+            "AI company funding",
+            "cybersecurity breaches 2024",
+            "cloud computing trends",
+        ],
+        "max_results": 15,
+        "include_metadata": True,
+    }
 
-    # Use case 1: Research assistance
-    print("\nUse Case 1: Research Assistant")
-    research_result = search_tool.invoke(
-        {
-            "objective": "Analysis of renewable energy adoption trends in 2024",
-            "source_policy": {
-                "include_domains": ["iea.org", "irena.org", "energy.gov", "nature.com"],
-                "exclude_domains": ["blog.com", "personal-site.com"],
-            },
-            "max_results": 10,
-            "excerpts": {"max_chars_per_result": 2500},
-            "include_metadata": True,
-        }
-    )
+    # Use case 3: Competitive analysis
+    competitor_query = {
+        "objective": (
+            "Latest product launches and strategic moves by major tech companies"
+        ),
+        "source_policy": {
+            "include_domains": [
+                "techcrunch.com",
+                "theverge.com",
+                "wired.com",
+                "ars-technica.com",
+            ],
+            "exclude_domains": ["reddit.com", "twitter.com"],
+        },
+        "max_results": 12,
+        "include_metadata": True,
+    }
+
+    return research_query, news_query, competitor_query
 
+
+def _display_use_cases(
+    research_result: dict[str, Any],
+    news_result: dict[str, Any],
+    competitor_result: dict[str, Any],
+) -> None:
+    """Print the outcome of each practical use case."""
+    print("\nUse Case 1: Research Assistant")
     print("Research completed - energy analysis")
     print(f"Found {len(research_result.get('results', []))} authoritative sources")
     display_metadata(research_result)
 
-    # Use case 2: News monitoring
     print("\nUse Case 2: News Monitoring Dashboard")
-    news_result = search_tool.invoke(
-        {
-            "search_queries": [
-                "tech industry news today",
-                "AI company funding",
-                "cybersecurity breaches 2024",
-                "cloud computing trends",
-            ],
-            "max_results": 15,
-            "include_metadata": True,
-        }
-    )
-
     print("News monitoring completed")
     print(f"Found {len(news_result.get('results', []))} relevant news items")
     display_metadata(news_result)
 
-    # Use case 3: Competitive analysis
     print("\nUse Case 3: Competitive Analysis")
-    competitor_result = search_tool.invoke(
-        {
-            "objective": (
-                "Latest product launches and strategic moves by major tech companies"
-            ),
-            "source_policy": {
-                "include_domains": [
-                    "techcrunch.com",
-                    "theverge.com",
-                    "wired.com",
-                    "ars-technica.com",
-                ],
-                "exclude_domains": ["reddit.com", "twitter.com"],
-            },
-            "max_results": 12,
-            "include_metadata": True,
-        }
-    )
-
     print("Competitive analysis completed")
     display_results(competitor_result, max_results=2)
     display_metadata(competitor_result)
 
 
+def practical_use_cases() -> None:
+    """Practical use case examples, run one after another."""
+    print("\n=== Practical Use Cases ===")
+
+    search_tool = _get_search_tool()
+    results = [search_tool.invoke(query) for query in _use_case_queries()]
+    _display_use_cases(*results)
+
+
+async def async_practical_use_cases() -> None:
+    """Practical use case examples, run concurrently.
+
+    The three use cases are independent, so the total wall time is that of the
+    slowest search rather than their sum.
+    """
+    print("\n=== Practical Use Cases (Async) ===")
+
+    search_tool = _get_search_tool()
+    results = await asyncio.gather(
+        *(search_tool.ainvoke(query) for query in _use_case_queries())
+    )
+    _display_use_cases(*results)
+
+
 async def main() -> None:
     """Main function demonstrating Parallel Web Search Tool usage."""
     print("=== Parallel Search Examples ===")
@@ -284,7 +332,7 @@ async def main() -> None:
         await async_search_examples()
 
         # Practical use cases
-        practical_use_cases()
+        await async_practical_use_cases()
 
         print("\n=== All examples completed successfully ===")
         print("\nKey features demonstrated:")
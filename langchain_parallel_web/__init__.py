@@ -1,13 +1,26 @@
-from importlib import metadata
+from importlib import import_module, metadata
+from typing import TYPE_CHECKING, Any
 
 from langchain_parallel_web._types import (
     ExcerptSettings,
     FetchPolicy,
     FullContentSettings,
 )
-from langchain_parallel_web.chat_models import ChatParallelWeb
-from langchain_parallel_web.extract_tool import ParallelExtractTool
-from langchain_parallel_web.search_tool import ParallelWebSearchTool
+
+if TYPE_CHECKING:
+    from langchain_parallel_web._client import TTLCache
+    from langchain_parallel_web.chat_models import ChatParallelWeb
+    from langchain_parallel_web.extract_tool import ParallelExtractTool
+    from langchain_parallel_web.search_tool import ParallelWebSearchTool
+
+# Integrations are imported on first attribute access (PEP 562) so that, e.g.,
+# using only ParallelExtractTool does not pay for importing the OpenAI SDK.
+_LAZY_IMPORTS = {
+    "ChatParallelWeb": "langchain_parallel_web.chat_models",
+    "ParallelExtractTool": "langchain_parallel_web.extract_tool",
+    "ParallelWebSearchTool": "langchain_parallel_web.search_tool",
+    "TTLCache": "langchain_parallel_web._client",
+}
 
 try:
     __version__ = metadata.version(__package__ or __name__)
@@ -16,6 +29,21 @@ except metadata.PackageNotFoundError:
     __version__ = ""
 del metadata  # optional, avoids polluting the results of dir(__package__)
 
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
+
+
 __all__ = [
     "ChatParallelWeb",
     "ExcerptSettings",
@@ -23,5 +51,6 @@ __all__ = [
     "FullContentSettings",
     "ParallelExtractTool",
     "ParallelWebSearchTool",
+    "TTLCache",
     "__version__",
 ]
@@ -2,11 +2,58 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import functools
+import hashlib
+import importlib.util
+import json
 import os
-from typing import Any, Optional, Union
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+)
+from typing import TYPE_CHECKING, Any, Optional, TypedDict, Union
 
-import openai
-from parallel import AsyncParallel, Parallel
+import httpx
+from parallel import (
+    AsyncParallel,
+    DefaultAsyncHttpxClient,
+    DefaultHttpxClient,
+    Parallel,
+)
+from typing_extensions import Self
+
+if TYPE_CHECKING:
+    import openai
+
+# orjson (the ``orjson`` extra) is an optional, faster drop-in for decoding
+# large API responses
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads  # type: ignore[assignment]
+
+# HTTP/2 lets concurrent requests share one multiplexed connection. httpx only
+# supports it when the optional ``h2`` package is installed.
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Failed requests from connection errors, timeouts, 408/409/429 and 5xx are
+# retried by the SDKs with jittered exponential backoff; other 4xx never are
+DEFAULT_MAX_RETRIES = 2
+
+_API_KEY_ENV_VAR = "PARALLEL_API_KEY"
+_MISSING_API_KEY_MSG = (
+    "Parallel API key not found. Please pass it as an argument or set the "
+    f"{_API_KEY_ENV_VAR} environment variable."
+)
 
 
 def get_api_key(api_key: Optional[str] = None) -> str:
@@ -24,39 +71,544 @@ def get_api_key(api_key: Optional[str] = None) -> str:
     if api_key:
         return api_key
 
-    env_key = os.environ.get("PARALLEL_API_KEY")
+    # Deliberately not memoized: the environment may change between calls
+    # (e.g. key rotation), and this lookup is already a single dict access.
+    env_key = os.environ.get(_API_KEY_ENV_VAR)
     if env_key:
         return env_key
 
-    msg = (
-        "Parallel API key not found. Please pass it as an argument or set the "
-        "PARALLEL_API_KEY environment variable."
+    raise ValueError(_MISSING_API_KEY_MSG)
+
+
+SHARED_POOL_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+"""Connection limits of the process-wide pool behind shared sync clients.
+
+Async clients use the same limits for their own pools, so a concurrent
+fan-out keeps its connections alive for the next round of requests.
+"""
+
+
+@functools.cache
+def _get_shared_http_client() -> httpx.Client:
+    """Return the process-wide sync HTTP pool, creating it on first use.
+
+    Every shared SDK client (Parallel and OpenAI, for any API key) sends its
+    requests through this one pool, so they multiplex over the same HTTP/2
+    connections to the API host.
+    """
+    return DefaultHttpxClient(http2=_HTTP2_AVAILABLE, limits=SHARED_POOL_LIMITS)
+
+
+def get_openai_client(
+    api_key: str,
+    base_url: str,
+    *,
+    timeout: Optional[float] = None,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+) -> openai.OpenAI:
+    """Returns a configured sync OpenAI client for the Chat API.
+
+    Clients are shared between callers with the same settings, so chat models
+    built with them reuse one connection pool.
+    """
+    return _get_shared_openai_client(api_key, base_url, timeout, max_retries)
+
+
+@functools.lru_cache(maxsize=32)
+def _get_shared_openai_client(
+    api_key: str,
+    base_url: str,
+    timeout: Optional[float],
+    max_retries: int,
+) -> openai.OpenAI:
+    # Imported lazily so the search and extract tools don't load the OpenAI SDK
+    import openai
+
+    return openai.OpenAI(
+        api_key=api_key,
+        base_url=base_url,
+        # None keeps the SDK's default timeout rather than disabling it
+        timeout=openai.NOT_GIVEN if timeout is None else timeout,
+        max_retries=max_retries,
+        http_client=_get_shared_http_client(),
+    )
+
+
+def get_async_openai_client(
+    api_key: str,
+    base_url: str,
+    *,
+    timeout: Optional[float] = None,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+) -> openai.AsyncOpenAI:
+    """Returns a configured async OpenAI client for the Chat API.
+
+    Unlike sync clients these are not shared: their connections belong to the
+    event loop they were opened on.
+    """
+    import openai
+
+    return openai.AsyncOpenAI(
+        api_key=api_key,
+        base_url=base_url,
+        timeout=openai.NOT_GIVEN if timeout is None else timeout,
+        max_retries=max_retries,
+        http_client=openai.DefaultAsyncHttpxClient(
+            http2=_HTTP2_AVAILABLE, limits=SHARED_POOL_LIMITS
+        ),
+    )
+
+
+ResponseCache = MutableMapping[str, dict[str, Any]]
+"""Mapping used to cache API responses, keyed by a hash of the request.
+
+Any mutable mapping works, e.g. a plain ``dict``, a ``TTLCache`` or a
+``diskcache.Cache``.
+"""
+
+_CACHE_TTL_ENV_VAR = "PARALLEL_CACHE_TTL"
+DEFAULT_CACHE_TTL = 300.0
+"""Default ``TTLCache`` entry lifetime in seconds."""
+
+
+class TTLCache(MutableMapping[str, dict[str, Any]]):
+    """Thread-safe in-memory response cache with LRU eviction and expiry.
+
+    Entries expire ``ttl`` seconds after they are stored, and once ``maxsize``
+    entries are held the least recently used one is evicted. Pass an instance
+    as the ``cache`` of a tool or client to serve repeated identical requests
+    from memory.
+
+    Args:
+        maxsize: Maximum number of responses kept.
+        ttl: Entry lifetime in seconds. Defaults to the ``PARALLEL_CACHE_TTL``
+            environment variable, or 300 seconds if it is unset.
+        timer: Clock used for expiry, monotonic by default.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: Optional[float] = None,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        if ttl is None:
+            ttl = float(os.environ.get(_CACHE_TTL_ENV_VAR, DEFAULT_CACHE_TTL))
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.timer = timer
+        # key -> (expires_at, response), ordered from least to most recent use
+        self._data: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getitem__(self, key: str) -> dict[str, Any]:
+        with self._lock:
+            expires_at, value = self._data[key]
+            if expires_at <= self.timer():
+                del self._data[key]
+                raise KeyError(key)
+            self._data.move_to_end(key)
+            return value
+
+    def __setitem__(self, key: str, value: dict[str, Any]) -> None:
+        with self._lock:
+            self._data[key] = (self.timer() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def __delitem__(self, key: str) -> None:
+        with self._lock:
+            del self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            self._expire()
+            return iter(list(self._data))
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._expire()
+            return len(self._data)
+
+    def _expire(self) -> None:
+        now = self.timer()
+        for key in [k for k, (exp, _) in self._data.items() if exp <= now]:
+            del self._data[key]
+
+
+def _cache_key(operation: str, kwargs: Mapping[str, Any]) -> str:
+    """Build a stable cache key from an operation name and its SDK kwargs.
+
+    The request timeout does not change the response, so it is left out.
+    """
+    payload = {key: value for key, value in kwargs.items() if key != "timeout"}
+    data = json.dumps([operation, payload], sort_keys=True, default=str)
+    return hashlib.blake2b(data.encode(), digest_size=16).hexdigest()
+
+
+DEFAULT_SEARCH_TIMEOUT = 30.0
+"""Default Search API timeout in seconds for modes without their own entry."""
+
+SEARCH_TIMEOUT_BY_MODE: dict[str, float] = {
+    "one-shot": DEFAULT_SEARCH_TIMEOUT,
+    "agentic": DEFAULT_SEARCH_TIMEOUT,
+}
+"""Default Search API timeout in seconds, keyed by search mode.
+
+Callers can tune entries (or add ones for new modes) without code changes.
+Each search client can also override these with its own ``default_timeout``
+and ``timeouts_by_mode``; a ``timeout`` passed to ``search`` always takes
+precedence.
+"""
+
+
+def _get_search_timeout(mode: Optional[str]) -> float:
+    """Return the default timeout for a search mode."""
+    if mode is None:
+        return DEFAULT_SEARCH_TIMEOUT
+    return SEARCH_TIMEOUT_BY_MODE.get(mode, DEFAULT_SEARCH_TIMEOUT)
+
+
+def _consume_exception(future: asyncio.Future[Any]) -> None:
+    # Mark a failure as retrieved so asyncio does not log it when no concurrent
+    # caller ended up waiting on the shared future
+    if not future.cancelled():
+        future.exception()
+
+
+async def _single_flight(
+    inflight: dict[str, asyncio.Future[dict[str, Any]]],
+    key: str,
+    call: Callable[[], Awaitable[dict[str, Any]]],
+) -> dict[str, Any]:
+    """Run ``call`` once for concurrent callers that share the same ``key``.
+
+    The request runs in its own task, and callers arriving while it is still
+    in flight await the same result (or exception) instead of sending their
+    own. Every caller, including the one that started it, waits through
+    :func:`asyncio.shield`, so cancelling one of them leaves the request and
+    the other callers alone.
+    """
+    future = inflight.get(key)
+    if future is None:
+        future = asyncio.ensure_future(call())
+        future.add_done_callback(_consume_exception)
+        future.add_done_callback(lambda done: _forget_inflight(inflight, key, done))
+        inflight[key] = future
+    return await asyncio.shield(future)
+
+
+def _forget_inflight(
+    inflight: dict[str, asyncio.Future[dict[str, Any]]],
+    key: str,
+    future: asyncio.Future[dict[str, Any]],
+) -> None:
+    if inflight.get(key) is future:
+        del inflight[key]
+
+
+# Connection warming only needs the TCP/TLS handshake, not a useful answer
+_WARM_TIMEOUT = 5.0
+
+
+def _warm_connection(http_client: httpx.Client, url: str) -> None:
+    """Open a pooled connection to ``url`` ahead of the first real request.
+
+    Best-effort: any failure is ignored and left for the real request to
+    surface.
+    """
+    with contextlib.suppress(Exception):
+        http_client.head(url, timeout=_WARM_TIMEOUT)
+
+
+async def _awarm_connection(http_client: httpx.AsyncClient, url: str) -> None:
+    """Async counterpart of ``_warm_connection``."""
+    with contextlib.suppress(Exception):
+        await http_client.head(url, timeout=_WARM_TIMEOUT)
+
+
+class _SearchKwargs(TypedDict, total=False):
+    """Keyword arguments passed to the SDK's ``beta.search``.
+
+    Typing the payload lets mypy check field names and value types where it is
+    built, so no separate runtime schema validation is needed per request.
+    """
+
+    objective: Optional[str]
+    search_queries: Optional[list[str]]
+    max_results: int
+    timeout: float
+    excerpts: dict[str, Any]
+    mode: str
+    source_policy: dict[str, Union[str, list[str]]]
+    fetch_policy: dict[str, Any]
+
+
+def _build_search_kwargs(
+    *,
+    objective: Optional[str],
+    search_queries: Optional[list[str]],
+    max_results: int,
+    excerpts: Optional[dict[str, Any]],
+    mode: Optional[str],
+    source_policy: Optional[dict[str, Union[str, list[str]]]],
+    fetch_policy: Optional[dict[str, Any]],
+    timeout: float,
+) -> _SearchKwargs:
+    """Validate search arguments and build the SDK call kwargs.
+
+    Shared by the sync and async clients so both send identical payloads. The
+    clients resolve ``timeout`` from their own per-mode defaults first.
+    """
+    if not objective and not search_queries:
+        msg = "Either 'objective' or 'search_queries' must be provided"
+        raise ValueError(msg)
+
+    # Build kwargs, only including non-None values for optional params
+    kwargs: _SearchKwargs = {
+        "objective": objective,
+        "search_queries": search_queries,
+        "max_results": max_results,
+        "timeout": timeout,
+    }
+    if excerpts is not None:
+        kwargs["excerpts"] = excerpts
+    if mode is not None:
+        kwargs["mode"] = mode
+    if source_policy is not None:
+        kwargs["source_policy"] = source_policy
+    if fetch_policy is not None:
+        kwargs["fetch_policy"] = fetch_policy
+
+    return kwargs
+
+
+def _new_parallel_client(api_key: str, base_url: str, max_retries: int) -> Parallel:
+    return Parallel(
+        api_key=api_key,
+        base_url=base_url,
+        max_retries=max_retries,
+        http_client=DefaultHttpxClient(http2=_HTTP2_AVAILABLE),
+    )
+
+
+def _new_async_parallel_client(
+    api_key: str, base_url: str, max_retries: int
+) -> AsyncParallel:
+    return AsyncParallel(
+        api_key=api_key,
+        base_url=base_url,
+        max_retries=max_retries,
+        http_client=DefaultAsyncHttpxClient(
+            http2=_HTTP2_AVAILABLE, limits=SHARED_POOL_LIMITS
+        ),
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _get_shared_parallel_client(
+    api_key: str, base_url: str, max_retries: int
+) -> Parallel:
+    """Return the process-wide sync SDK client for these settings.
+
+    Sync clients are thread-safe, so every tool built with the same settings
+    reuses one client, and all of them use the shared HTTP pool. Async clients
+    are not shared since their connections belong to the event loop they were
+    opened on.
+    """
+    return Parallel(
+        api_key=api_key,
+        base_url=base_url,
+        max_retries=max_retries,
+        http_client=_get_shared_http_client(),
     )
-    raise ValueError(msg)
 
 
-def get_openai_client(api_key: str, base_url: str) -> openai.OpenAI:
-    """Returns a configured sync OpenAI client for the Chat API."""
-    return openai.OpenAI(api_key=api_key, base_url=base_url)
+class _SyncClient:
+    """Connection lifecycle shared by the sync API clients."""
+
+    base_url: str
+    cache: Optional[ResponseCache]
+    client: Parallel
+    _owns_client: bool
+
+    def _warm(self) -> None:
+        # Do the TLS handshake in the background, off the first request
+        threading.Thread(
+            target=_warm_connection,
+            args=(self.client._client, self.base_url),
+            daemon=True,
+        ).start()
+
+    def _cached_call(
+        self,
+        operation: str,
+        kwargs: Mapping[str, Any],
+        call: Callable[[], dict[str, Any]],
+        *,
+        use_cache: bool = True,
+    ) -> dict[str, Any]:
+        """Return ``call()``, served from and stored in the cache if one is set."""
+        if self.cache is None or not use_cache:
+            return call()
 
+        cache_key = _cache_key(operation, kwargs)
+        response = self.cache.get(cache_key)
+        if response is None:
+            response = call()
+            self.cache[cache_key] = response
+        # Hand out a copy so callers can annotate it without touching the cache
+        return dict(response)
 
-def get_async_openai_client(api_key: str, base_url: str) -> openai.AsyncOpenAI:
-    """Returns a configured async OpenAI client for the Chat API."""
-    return openai.AsyncOpenAI(api_key=api_key, base_url=base_url)
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool, unless it is shared."""
+        if self._owns_client:
+            self.client.close()
 
+    def __enter__(self) -> Self:
+        return self
 
-class ParallelSearchClient:
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+
+class _AsyncClient:
+    """Connection lifecycle and concurrency limits shared by the async clients.
+
+    With ``max_concurrency`` set, at most that many requests are sent at once
+    and further calls wait their turn. Fewer simultaneous requests can lower
+    overall latency when a large fan-out would otherwise overload the API.
+    """
+
+    base_url: str
+    cache: Optional[ResponseCache]
+    client: AsyncParallel
+    _inflight: dict[str, asyncio.Future[dict[str, Any]]]
+
+    def _init_warm(self, *, warm: bool) -> None:
+        # Warming needs an event loop; without one running yet it is deferred
+        # to the first ``async with``
+        self._warm_pending = warm
+        self._warm_task: Optional[asyncio.Task[None]] = None
+        with contextlib.suppress(RuntimeError):
+            asyncio.get_running_loop()
+            self._start_warm()
+
+    def _start_warm(self) -> None:
+        if self._warm_pending:
+            self._warm_pending = False
+            # Keep a reference so the task is not garbage collected mid-flight
+            self._warm_task = asyncio.create_task(
+                _awarm_connection(self.client._client, self.base_url)
+            )
+
+    def _init_concurrency(self, max_concurrency: Optional[int]) -> None:
+        # Capping in-flight requests queues excess calls here instead of
+        # overloading the API; ``None`` leaves them unbounded
+        self.max_concurrency = max_concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @contextlib.asynccontextmanager
+    async def _request_slot(self) -> AsyncIterator[None]:
+        """Hold one of ``max_concurrency`` request slots while sending."""
+        if self.max_concurrency is None:
+            yield
+            return
+        if self._semaphore is None:
+            # Created on first use so it belongs to the running event loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._semaphore:
+            yield
+
+    async def _cached_call(
+        self,
+        operation: str,
+        kwargs: Mapping[str, Any],
+        call: Callable[[], Awaitable[dict[str, Any]]],
+        *,
+        use_cache: bool = True,
+    ) -> dict[str, Any]:
+        """Await ``call()`` once per distinct request, using the cache if set.
+
+        Identical calls made while one is in flight share its response.
+        """
+        cache = self.cache if use_cache else None
+        cache_key = _cache_key(operation, kwargs)
+        response = None if cache is None else cache.get(cache_key)
+        if response is None:
+            response = await _single_flight(self._inflight, cache_key, call)
+            if cache is not None:
+                cache[cache_key] = response
+        # Hand out a copy so callers can annotate it without touching the cache
+        # or each other's results
+        return dict(response)
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        if self._warm_task is not None:
+            self._warm_task.cancel()
+        await self.client.close()
+
+    async def __aenter__(self) -> Self:
+        self._start_warm()
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.aclose()
+
+
+class _SearchTimeouts:
+    """Default request timeouts shared by the sync and async search clients.
+
+    A per-mode entry in ``timeouts_by_mode`` wins, then ``default_timeout``,
+    then the module-wide ``SEARCH_TIMEOUT_BY_MODE`` table. A ``timeout``
+    passed to ``search`` always takes precedence over all of them.
+    """
+
+    def _init_timeouts(
+        self,
+        default_timeout: Optional[float],
+        timeouts_by_mode: Optional[Mapping[str, float]],
+    ) -> None:
+        self.default_timeout = default_timeout
+        self.timeouts_by_mode = dict(timeouts_by_mode or {})
+
+    def _get_search_timeout(self, mode: Optional[str]) -> float:
+        """Return this client's default timeout for a search mode."""
+        if mode is not None and mode in self.timeouts_by_mode:
+            return self.timeouts_by_mode[mode]
+        if self.default_timeout is not None:
+            return self.default_timeout
+        return _get_search_timeout(mode)
+
+
+class ParallelSearchClient(_SearchTimeouts, _SyncClient):
     """Synchronous client for Parallel Search API using the Parallel SDK."""
 
     def __init__(
         self,
         api_key: str,
         base_url: str = "https://api.parallel.ai",
+        cache: Optional[ResponseCache] = None,
+        *,
+        warm: bool = False,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        client: Optional[Parallel] = None,
+        default_timeout: Optional[float] = None,
+        timeouts_by_mode: Optional[Mapping[str, float]] = None,
     ):
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
-        # Initialize the Parallel SDK client
-        self.client = Parallel(api_key=api_key, base_url=base_url)
+        # Optional response cache; identical requests skip the network
+        self.cache = cache
+        self._init_timeouts(default_timeout, timeouts_by_mode)
+        # Use the given SDK client (e.g. one shared between tools), otherwise
+        # build one whose connection pool is reused across searches
+        self._owns_client = client is None
+        self.client = client or _new_parallel_client(api_key, base_url, max_retries)
+        if warm:
+            self._warm()
 
     def search(
         self,
@@ -70,49 +622,53 @@ class ParallelSearchClient:
         timeout: Optional[float] = None,
     ) -> dict[str, Any]:
         """Perform a synchronous search using the Parallel Search API via SDK."""
-        if not objective and not search_queries:
-            msg = "Either 'objective' or 'search_queries' must be provided"
-            raise ValueError(msg)
-
-        # Use default timeout if not provided
-        if timeout is None:
-            timeout = 30.0
-
-        # Build kwargs, only including non-None values for optional params
-        kwargs: dict[str, Any] = {
-            "objective": objective,
-            "search_queries": search_queries,
-            "max_results": max_results,
-            "timeout": timeout,
-        }
-        if excerpts is not None:
-            kwargs["excerpts"] = excerpts
-        if mode is not None:
-            kwargs["mode"] = mode
-        if source_policy is not None:
-            kwargs["source_policy"] = source_policy
-        if fetch_policy is not None:
-            kwargs["fetch_policy"] = fetch_policy
+        kwargs = _build_search_kwargs(
+            objective=objective,
+            search_queries=search_queries,
+            max_results=max_results,
+            excerpts=excerpts,
+            mode=mode,
+            source_policy=source_policy,
+            fetch_policy=fetch_policy,
+            timeout=self._get_search_timeout(mode) if timeout is None else timeout,
+        )
 
-        # Use the Parallel SDK's beta.search method
-        search_response = self.client.beta.search(**kwargs)
+        return self._cached_call("search", kwargs, lambda: self._search(kwargs))
 
-        # Convert the SDK response to a dictionary
-        return search_response.model_dump()
+    def _search(self, kwargs: _SearchKwargs) -> dict[str, Any]:
+        # Use the Parallel SDK's beta.search method, decoding the raw JSON body
+        # straight to a dict instead of building SDK models and dumping them
+        raw_response = self.client.beta.with_raw_response.search(**kwargs)
+        return _json_loads(raw_response.read())
 
 
-class AsyncParallelSearchClient:
+class AsyncParallelSearchClient(_SearchTimeouts, _AsyncClient):
     """Asynchronous client for Parallel Search API using the Parallel SDK."""
 
     def __init__(
         self,
         api_key: str,
         base_url: str = "https://api.parallel.ai",
+        cache: Optional[ResponseCache] = None,
+        *,
+        warm: bool = False,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        max_concurrency: Optional[int] = None,
+        default_timeout: Optional[float] = None,
+        timeouts_by_mode: Optional[Mapping[str, float]] = None,
     ):
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
-        # Initialize the Parallel SDK async client
-        self.client = AsyncParallel(api_key=api_key, base_url=base_url)
+        # Optional response cache; identical requests skip the network
+        self.cache = cache
+        self._init_timeouts(default_timeout, timeouts_by_mode)
+        # Requests currently in flight, so identical concurrent calls share one
+        self._inflight = {}
+        # Initialize the Parallel SDK async client once so concurrent searches
+        # share a single connection pool
+        self.client = _new_async_parallel_client(api_key, base_url, max_retries)
+        self._init_warm(warm=warm)
+        self._init_concurrency(max_concurrency)
 
     async def search(
         self,
@@ -126,63 +682,157 @@ class AsyncParallelSearchClient:
         timeout: Optional[float] = None,
     ) -> dict[str, Any]:
         """Perform an async search using the Parallel Search API via SDK."""
-        if not objective and not search_queries:
-            msg = "Either 'objective' or 'search_queries' must be provided"
-            raise ValueError(msg)
-
-        # Use default timeout if not provided
-        if timeout is None:
-            timeout = 30.0
-
-        # Build kwargs, only including non-None values for optional params
-        kwargs: dict[str, Any] = {
-            "objective": objective,
-            "search_queries": search_queries,
-            "max_results": max_results,
-            "timeout": timeout,
-        }
-        if excerpts is not None:
-            kwargs["excerpts"] = excerpts
-        if mode is not None:
-            kwargs["mode"] = mode
-        if source_policy is not None:
-            kwargs["source_policy"] = source_policy
-        if fetch_policy is not None:
-            kwargs["fetch_policy"] = fetch_policy
+        kwargs = _build_search_kwargs(
+            objective=objective,
+            search_queries=search_queries,
+            max_results=max_results,
+            excerpts=excerpts,
+            mode=mode,
+            source_policy=source_policy,
+            fetch_policy=fetch_policy,
+            timeout=self._get_search_timeout(mode) if timeout is None else timeout,
+        )
 
-        # Use the Parallel SDK's beta.search method
-        search_response = await self.client.beta.search(**kwargs)
+        return await self._cached_call("search", kwargs, lambda: self._search(kwargs))
 
-        # Convert the SDK response to a dictionary
-        return search_response.model_dump()
+    async def _search(self, kwargs: _SearchKwargs) -> dict[str, Any]:
+        # Use the Parallel SDK's beta.search method, decoding the raw JSON body
+        # straight to a dict instead of building SDK models and dumping them
+        async with self._request_slot():
+            raw_response = await self.client.beta.with_raw_response.search(**kwargs)
+            return _json_loads(await raw_response.read())
 
 
 def get_search_client(
-    api_key: str, base_url: str = "https://api.parallel.ai"
+    api_key: str,
+    base_url: str = "https://api.parallel.ai",
+    cache: Optional[ResponseCache] = None,
+    *,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    default_timeout: Optional[float] = None,
+    timeouts_by_mode: Optional[Mapping[str, float]] = None,
 ) -> ParallelSearchClient:
-    """Returns a configured sync Parallel Search client."""
-    return ParallelSearchClient(api_key, base_url)
+    """Returns a configured sync Parallel Search client.
+
+    Its SDK connection pool is shared with every other sync search and extract
+    client created here with the same settings.
+    """
+    return ParallelSearchClient(
+        api_key,
+        base_url,
+        cache=cache,
+        client=_get_shared_parallel_client(api_key, base_url, max_retries),
+        default_timeout=default_timeout,
+        timeouts_by_mode=timeouts_by_mode,
+    )
 
 
 def get_async_search_client(
-    api_key: str, base_url: str = "https://api.parallel.ai"
+    api_key: str,
+    base_url: str = "https://api.parallel.ai",
+    cache: Optional[ResponseCache] = None,
+    *,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    default_timeout: Optional[float] = None,
+    timeouts_by_mode: Optional[Mapping[str, float]] = None,
 ) -> AsyncParallelSearchClient:
     """Returns a configured async Parallel Search client."""
-    return AsyncParallelSearchClient(api_key, base_url)
+    return AsyncParallelSearchClient(
+        api_key,
+        base_url,
+        cache=cache,
+        max_retries=max_retries,
+        default_timeout=default_timeout,
+        timeouts_by_mode=timeouts_by_mode,
+    )
+
 
+EXTRACT_TIMEOUT_BASE = 10.0
+"""Fixed part of the default Extract API timeout, in seconds."""
+
+EXTRACT_TIMEOUT_PER_URL = 2.0
+"""Seconds added to the default Extract API timeout for each URL."""
+
+EXTRACT_TIMEOUT_CAP = 120.0
+"""Upper bound on the default Extract API timeout, in seconds.
+
+Large batches would otherwise get timeouts long enough to hide a stuck
+request; failing fast lets the SDK retry on a fresh connection instead.
+"""
+
+
+def _get_extract_timeout(url_count: int) -> float:
+    """Return the default timeout for extracting ``url_count`` URLs."""
+    return min(
+        EXTRACT_TIMEOUT_BASE + EXTRACT_TIMEOUT_PER_URL * url_count,
+        EXTRACT_TIMEOUT_CAP,
+    )
 
-class ParallelExtractClient:
+
+def _allows_cached_response(fetch_policy: Optional[Mapping[str, Any]]) -> bool:
+    """Whether a local cache may answer an extract with this fetch policy.
+
+    ``disable_cache_fallback`` asks for an error rather than stale content, so
+    such requests always go to the API.
+    """
+    return not (fetch_policy and fetch_policy.get("disable_cache_fallback"))
+
+
+def _build_extract_kwargs(
+    *,
+    urls: list[str],
+    objective: Optional[str],
+    search_queries: Optional[list[str]],
+    excerpts: Optional[Union[bool, dict[str, Any]]],
+    full_content: Optional[Union[bool, dict[str, Any]]],
+    fetch_policy: Optional[dict[str, Any]],
+    timeout: Optional[float],
+) -> dict[str, Any]:
+    """Validate extract arguments and build the SDK call kwargs.
+
+    Shared by the sync and async clients so both send identical payloads.
+    """
+    if not urls:
+        msg = "At least one URL must be provided"
+        raise ValueError(msg)
+
+    if timeout is None:
+        timeout = _get_extract_timeout(len(urls))
+
+    return {
+        "urls": urls,
+        "objective": objective,
+        "search_queries": search_queries,
+        "excerpts": excerpts,
+        "full_content": full_content,
+        "fetch_policy": fetch_policy,
+        "timeout": timeout,
+    }
+
+
+class ParallelExtractClient(_SyncClient):
     """Synchronous client for Parallel Extract API using the Parallel SDK."""
 
     def __init__(
         self,
         api_key: str,
         base_url: str = "https://api.parallel.ai",
+        cache: Optional[ResponseCache] = None,
+        *,
+        warm: bool = False,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        client: Optional[Parallel] = None,
     ):
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
-        # Initialize the Parallel SDK client
-        self.client = Parallel(api_key=api_key, base_url=base_url)
+        # Optional response cache; identical requests skip the network
+        self.cache = cache
+        # Use the given SDK client (e.g. one shared between tools), otherwise
+        # build a dedicated one
+        self._owns_client = client is None
+        self.client = client or _new_parallel_client(api_key, base_url, max_retries)
+        if warm:
+            self._warm()
 
     def extract(
         self,
@@ -195,16 +845,7 @@ class ParallelExtractClient:
         timeout: Optional[float] = None,
     ) -> dict[str, Any]:
         """Perform a synchronous extract using the Parallel Extract API via SDK."""
-        if not urls:
-            msg = "At least one URL must be provided"
-            raise ValueError(msg)
-
-        # Use default timeout if not provided (5 seconds per URL)
-        if timeout is None:
-            timeout = 5.0 * len(urls)
-
-        # Use the Parallel SDK's beta.extract method
-        extract_response = self.client.beta.extract(
+        kwargs = _build_extract_kwargs(
             urls=urls,
             objective=objective,
             search_queries=search_queries,
@@ -214,22 +855,118 @@ class ParallelExtractClient:
             timeout=timeout,
         )
 
-        # Convert the SDK response to a dictionary
-        return extract_response.model_dump()
+        return self._cached_call(
+            "extract",
+            kwargs,
+            lambda: self._extract(kwargs),
+            use_cache=_allows_cached_response(fetch_policy),
+        )
+
+    def _extract(self, kwargs: dict[str, Any]) -> dict[str, Any]:
+        # Use the Parallel SDK's beta.extract method, decoding the raw JSON body
+        # straight to a dict instead of building SDK models and dumping them
+        raw_response = self.client.beta.with_raw_response.extract(**kwargs)
+        return _json_loads(raw_response.read())
+
+
+class _ExtractBatch:
+    """Extract calls with identical settings waiting to be sent together."""
+
+    def __init__(self, kwargs: dict[str, Any]):
+        # Shared call settings; ``urls`` and ``timeout`` are filled per batch
+        self.kwargs = kwargs
+        self.calls: list[tuple[list[str], asyncio.Future[dict[str, Any]]]] = []
+        self.urls: dict[str, None] = {}
+        self.timeout = 0.0
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+    def add(self, urls: list[str], timeout: float) -> asyncio.Future[dict[str, Any]]:
+        future = asyncio.get_running_loop().create_future()
+        self.calls.append((urls, future))
+        self.urls.update(dict.fromkeys(urls))
+        self.timeout = max(self.timeout, timeout)
+        return future
+
+
+def _split_batch_response(
+    response: dict[str, Any], urls: list[str]
+) -> tuple[dict[str, Any], list[str]]:
+    """Select the results and errors for ``urls`` from a batched response.
+
+    Also returns the URLs that have no entry under their exact URL (e.g.
+    because the API normalized them), since those cannot be attributed to a
+    caller from the batched response.
+    """
+    results = {result["url"]: result for result in response.get("results") or []}
+    errors = {error["url"]: error for error in response.get("errors") or []}
+    selected = {
+        **response,
+        "results": [results[url] for url in urls if url in results],
+        "errors": [errors[url] for url in urls if url in errors],
+    }
+    unmatched = [url for url in urls if url not in results and url not in errors]
+    return selected, unmatched
+
 
+class AsyncParallelExtractClient(_AsyncClient):
+    """Asynchronous client for Parallel Extract API using the Parallel SDK.
 
-class AsyncParallelExtractClient:
-    """Asynchronous client for Parallel Extract API using the Parallel SDK."""
+    With ``batch_window`` set, concurrent ``extract`` calls that share the same
+    settings are accumulated for up to that many seconds (or until
+    ``max_batch_size`` URLs are queued) and sent as a single request. Each
+    caller gets back the results and errors for its own URLs, matched by URL.
+    URLs missing from the batched response under their exact URL (e.g.
+    normalized by the API) are re-sent in a request of their own, so nothing
+    is dropped.
+    """
 
     def __init__(
         self,
         api_key: str,
         base_url: str = "https://api.parallel.ai",
+        cache: Optional[ResponseCache] = None,
+        *,
+        warm: bool = False,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        max_concurrency: Optional[int] = None,
+        batch_window: Optional[float] = None,
+        max_batch_size: int = 50,
     ):
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
+        # Optional response cache; identical requests skip the network
+        self.cache = cache
+        # Requests currently in flight, so identical concurrent calls share one
+        self._inflight = {}
+        # Optional micro-batching: calls with the same settings made within
+        # ``batch_window`` seconds are sent as one request of up to
+        # ``max_batch_size`` URLs
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self._batches: dict[str, _ExtractBatch] = {}
+        self._batch_tasks: set[asyncio.Task[None]] = set()
         # Initialize the Parallel SDK async client
-        self.client = AsyncParallel(api_key=api_key, base_url=base_url)
+        self.client = _new_async_parallel_client(api_key, base_url, max_retries)
+        self._init_warm(warm=warm)
+        self._init_concurrency(max_concurrency)
+
+    async def aclose(self) -> None:
+        """Cancel pending batches, then close the underlying connection pool.
+
+        Callers still waiting on a batch that has not been sent, or is being
+        sent, get a ``CancelledError``.
+        """
+        for batch in self._batches.values():
+            if batch.timer is not None:
+                batch.timer.cancel()
+            for _, future in batch.calls:
+                future.cancel()
+        self._batches.clear()
+        tasks = list(self._batch_tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await super().aclose()
 
     async def extract(
         self,
@@ -242,16 +979,7 @@ class AsyncParallelExtractClient:
         timeout: Optional[float] = None,
     ) -> dict[str, Any]:
         """Perform an async extract using the Parallel Extract API via SDK."""
-        if not urls:
-            msg = "At least one URL must be provided"
-            raise ValueError(msg)
-
-        # Use default timeout if not provided (5 seconds per URL)
-        if timeout is None:
-            timeout = 5.0 * len(urls)
-
-        # Use the Parallel SDK's beta.extract method
-        extract_response = await self.client.beta.extract(
+        kwargs = _build_extract_kwargs(
             urls=urls,
             objective=objective,
             search_queries=search_queries,
@@ -261,19 +989,163 @@ class AsyncParallelExtractClient:
             timeout=timeout,
         )
 
-        # Convert the SDK response to a dictionary
-        return extract_response.model_dump()
+        return await self._cached_call(
+            "extract",
+            kwargs,
+            lambda: self._extract(kwargs),
+            use_cache=_allows_cached_response(fetch_policy),
+        )
+
+    async def _extract(self, kwargs: dict[str, Any]) -> dict[str, Any]:
+        if self.batch_window is None:
+            return await self._send_extract(kwargs)
+        return await self._enqueue_extract(kwargs)
+
+    async def _send_extract(self, kwargs: dict[str, Any]) -> dict[str, Any]:
+        # Use the Parallel SDK's beta.extract method, decoding the raw JSON body
+        # straight to a dict instead of building SDK models and dumping them
+        async with self._request_slot():
+            raw_response = await self.client.beta.with_raw_response.extract(**kwargs)
+            return _json_loads(await raw_response.read())
+
+    async def _enqueue_extract(self, kwargs: dict[str, Any]) -> dict[str, Any]:
+        settings = {
+            key: value
+            for key, value in kwargs.items()
+            if key not in ("urls", "timeout")
+        }
+        batch_key = _cache_key("extract-batch", settings)
+        batch = self._batches.get(batch_key)
+        if batch is None:
+            batch = self._batches[batch_key] = _ExtractBatch(settings)
+            batch.timer = asyncio.get_running_loop().call_later(
+                self.batch_window, self._flush_batch, batch_key
+            )
+
+        future = batch.add(kwargs["urls"], kwargs["timeout"])
+        if len(batch.urls) >= self.max_batch_size:
+            self._flush_batch(batch_key)
+        return await future
+
+    def _flush_batch(self, batch_key: str) -> None:
+        batch = self._batches.pop(batch_key, None)
+        if batch is None:
+            return
+        if batch.timer is not None:
+            batch.timer.cancel()
+        # Keep a reference so the task is not garbage collected mid-flight
+        task = asyncio.create_task(self._send_batch(batch))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _send_batch(self, batch: _ExtractBatch) -> None:
+        try:
+            await self._deliver_batch(batch)
+        finally:
+            # If delivery stopped early (e.g. the task was cancelled), cancel
+            # the callers still waiting rather than leaving them pending
+            for _, future in batch.calls:
+                if not future.done():
+                    future.cancel()
+
+    async def _deliver_batch(self, batch: _ExtractBatch) -> None:
+        urls = list(batch.urls)
+        # Allow the default budget for the whole batch, or the longest timeout
+        # any caller asked for if that is more
+        timeout = max(batch.timeout, _get_extract_timeout(len(urls)))
+        try:
+            response = await self._send_extract(
+                {**batch.kwargs, "urls": urls, "timeout": timeout}
+            )
+        except Exception as e:
+            for _, future in batch.calls:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        if len(batch.calls) == 1:
+            # A lone caller owns the whole response, whatever URLs it lists
+            _, future = batch.calls[0]
+            if not future.done():
+                future.set_result(response)
+            return
+
+        resends = []
+        for call_urls, future in batch.calls:
+            selected, unmatched = _split_batch_response(response, call_urls)
+            if unmatched:
+                resends.append(
+                    self._resend_unmatched(batch, future, selected, unmatched)
+                )
+            elif not future.done():
+                future.set_result(selected)
+        await asyncio.gather(*resends)
+
+    async def _resend_unmatched(
+        self,
+        batch: _ExtractBatch,
+        future: asyncio.Future[dict[str, Any]],
+        selected: dict[str, Any],
+        urls: list[str],
+    ) -> None:
+        timeout = max(batch.timeout, _get_extract_timeout(len(urls)))
+        try:
+            response = await self._send_extract(
+                {**batch.kwargs, "urls": urls, "timeout": timeout}
+            )
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+            return
+
+        if not future.done():
+            future.set_result(
+                {
+                    **selected,
+                    "results": [
+                        *selected["results"],
+                        *(response.get("results") or []),
+                    ],
+                    "errors": [*selected["errors"], *(response.get("errors") or [])],
+                }
+            )
 
 
 def get_extract_client(
-    api_key: str, base_url: str = "https://api.parallel.ai"
+    api_key: str,
+    base_url: str = "https://api.parallel.ai",
+    cache: Optional[ResponseCache] = None,
+    *,
+    max_retries: int = DEFAULT_MAX_RETRIES,
 ) -> ParallelExtractClient:
-    """Returns a configured sync Parallel Extract client."""
-    return ParallelExtractClient(api_key, base_url)
+    """Returns a configured sync Parallel Extract client.
+
+    Its SDK connection pool is shared with every other sync search and extract
+    client created here with the same settings.
+    """
+    return ParallelExtractClient(
+        api_key,
+        base_url,
+        cache=cache,
+        client=_get_shared_parallel_client(api_key, base_url, max_retries),
+    )
 
 
 def get_async_extract_client(
-    api_key: str, base_url: str = "https://api.parallel.ai"
+    api_key: str,
+    base_url: str = "https://api.parallel.ai",
+    cache: Optional[ResponseCache] = None,
+    *,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    batch_window: Optional[float] = None,
+    max_batch_size: int = 50,
 ) -> AsyncParallelExtractClient:
     """Returns a configured async Parallel Extract client."""
-    return AsyncParallelExtractClient(api_key, base_url)
+    return AsyncParallelExtractClient(
+        api_key,
+        base_url,
+        cache=cache,
+        max_retries=max_retries,
+        batch_window=batch_window,
+        max_batch_size=max_batch_size,
+    )
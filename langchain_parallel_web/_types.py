@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from collections.abc import Mapping
+from typing import Any, Optional, Union
 
 from pydantic import BaseModel, Field
 
@@ -58,3 +59,15 @@ class FetchPolicy(BaseModel):
             "fetch fails or times out. If true, returns an error instead."
         ),
     )
+
+
+def dump_settings(settings: Union[BaseModel, Mapping[str, Any]]) -> dict[str, Any]:
+    """Return settings as API params, leaving out unset fields.
+
+    Equivalent to ``settings.model_dump(exclude_none=True)`` for the flat
+    settings models above, but reads the field values directly instead of
+    going through pydantic's serializer. Settings already given as a dict are
+    used as they are, without building a model first.
+    """
+    values = settings if isinstance(settings, Mapping) else settings.__dict__
+    return {name: value for name, value in values.items() if value is not None}
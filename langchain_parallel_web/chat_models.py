@@ -8,7 +8,9 @@ from __future__ import annotations
 
 import contextlib
 from collections.abc import AsyncIterator, Iterator
+from itertools import groupby
 from typing import Any, Optional, cast
+from urllib.parse import urlparse
 
 import openai
 from langchain_core.callbacks import (
@@ -28,7 +30,23 @@ from openai import AuthenticationError, RateLimitError
 from pydantic import Field, SecretStr, model_validator
 from typing_extensions import Self
 
-from ._client import get_api_key, get_async_openai_client, get_openai_client
+from ._client import (
+    DEFAULT_MAX_RETRIES,
+    get_api_key,
+    get_async_openai_client,
+    get_openai_client,
+)
+
+_MERGEABLE_MESSAGE_TYPES = (SystemMessage, HumanMessage, AIMessage)
+
+# OpenAI-compatible parameters accepted but ignored by Parallel's Chat API
+_PARALLEL_IGNORED_PARAMS = frozenset({"temperature", "max_tokens"})
+
+
+def _is_parallel_api(base_url: str) -> bool:
+    """Return whether a base URL points at Parallel's hosted API."""
+    hostname = urlparse(base_url).hostname or ""
+    return hostname == "parallel.ai" or hostname.endswith(".parallel.ai")
 
 
 def _convert_message_to_dict(message: BaseMessage) -> dict[str, Any]:
@@ -81,46 +99,22 @@ def _merge_consecutive_messages(messages: list[BaseMessage]) -> list[BaseMessage
     """Merge consecutive messages of the same type to satisfy API requirements.
 
     Parallel requires messages to alternate between user and assistant roles.
-    This function merges consecutive messages of the same type.
+    This function merges consecutive messages of the same type. Messages that
+    need no merging are passed through as-is rather than rebuilt, so a growing
+    conversation history is not re-allocated on every turn.
     """
-    if not messages:
-        return messages
-
     merged: list[BaseMessage] = []
-    current_content = []
-    current_type = None
-
-    for message in messages:
-        message_type = type(message)
-
-        if message_type == current_type:
-            # Same type as previous, accumulate content
-            current_content.append(str(message.content))
+    for message_type, group in groupby(messages, key=type):
+        if message_type not in _MERGEABLE_MESSAGE_TYPES:
+            continue
+
+        run = list(group)
+        if len(run) == 1 and isinstance(run[0].content, str):
+            # Nothing to merge, reuse the original message
+            merged.append(run[0])
         else:
-            # Different type, save previous and start new
-            if current_type is not None and current_content:
-                # Create merged message of the previous type
-                merged_content = "\n\n".join(current_content)
-                if current_type == SystemMessage:
-                    merged.append(SystemMessage(content=merged_content))
-                elif current_type == HumanMessage:
-                    merged.append(HumanMessage(content=merged_content))
-                elif current_type == AIMessage:
-                    merged.append(AIMessage(content=merged_content))
-
-            # Start new message
-            current_type = message_type
-            current_content = [str(message.content)]
-
-    # Don't forget the last message
-    if current_type is not None and current_content:
-        merged_content = "\n\n".join(current_content)
-        if current_type == SystemMessage:
-            merged.append(SystemMessage(content=merged_content))
-        elif current_type == HumanMessage:
-            merged.append(HumanMessage(content=merged_content))
-        elif current_type == AIMessage:
-            merged.append(AIMessage(content=merged_content))
+            merged_content = "\n\n".join(str(message.content) for message in run)
+            merged.append(message_type(content=merged_content))
 
     return merged
 
@@ -238,7 +232,7 @@ class ChatParallelWeb(BaseChatModel):
     timeout: Optional[float] = Field(default=None)
     """Timeout for requests."""
 
-    max_retries: int = Field(default=2)
+    max_retries: int = Field(default=DEFAULT_MAX_RETRIES)
     """Max number of retries."""
 
     # OpenAI-compatible parameters that are ignored by Parallel
@@ -287,9 +281,16 @@ class ChatParallelWeb(BaseChatModel):
         if not self.api_key:
             self.api_key = SecretStr(api_key_str)
 
-        # Initialize both sync and async OpenAI clients configured for Parallel
-        self._client = get_openai_client(api_key_str, self.base_url)
-        self._async_client = get_async_openai_client(api_key_str, self.base_url)
+        # The sync client is shared between models with the same settings, so
+        # this is a cache lookup. The async client gets its own connection
+        # pool and is built on first use instead, keeping construction cheap
+        # for models that are created often but only used synchronously.
+        self._client = get_openai_client(
+            api_key_str,
+            self.base_url,
+            timeout=self.timeout,
+            max_retries=self.max_retries,
+        )
         return self
 
     @property
@@ -306,11 +307,18 @@ class ChatParallelWeb(BaseChatModel):
     def async_client(self) -> openai.AsyncOpenAI:
         """Get the async OpenAI client, initializing if needed."""
         if self._async_client is None:
-            msg = (
-                "Async client not initialized. "
-                "Please ensure the model is properly validated."
+            if self.api_key is None:
+                msg = (
+                    "Async client not initialized. "
+                    "Please ensure the model is properly validated."
+                )
+                raise ValueError(msg)
+            self._async_client = get_async_openai_client(
+                self.api_key.get_secret_value(),
+                self.base_url,
+                timeout=self.timeout,
+                max_retries=self.max_retries,
             )
-            raise ValueError(msg)
         return self._async_client
 
     @property
@@ -354,6 +362,36 @@ class ChatParallelWeb(BaseChatModel):
         """Return whether this model can be serialized by LangChain."""
         return True
 
+    def _build_request_params(
+        self,
+        messages: list[BaseMessage],
+        stop: Optional[list[str]],
+        *,
+        stream: bool,
+    ) -> dict[str, Any]:
+        """Build chat completion kwargs, leaving out unset parameters.
+
+        Parameters that Parallel ignores are not sent to Parallel's own API, so
+        every request for the same conversation has the same canonical payload.
+        """
+        params: dict[str, Any] = {
+            "model": self.model,
+            "messages": cast(Any, _prepare_messages(messages)),
+            "stream": stream,
+        }
+        optional_params = {
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
+            "stop": stop,
+        }
+        skip = _PARALLEL_IGNORED_PARAMS if _is_parallel_api(self.base_url) else ()
+        params.update(
+            (key, value)
+            for key, value in optional_params.items()
+            if value is not None and key not in skip
+        )
+        return params
+
     @contextlib.contextmanager
     def _handle_errors(self) -> Iterator[None]:
         """Handle errors from Parallel API."""
@@ -445,17 +483,10 @@ class ChatParallelWeb(BaseChatModel):
         **kwargs: Any,
     ) -> ChatResult:
         """Generate a response using Parallel's chat API."""
-        openai_messages = _prepare_messages(messages)
+        params = self._build_request_params(messages, stop, stream=False)
 
         with self._handle_errors():
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=cast(Any, openai_messages),
-                stream=False,
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-                stop=stop,
-            )
+            response = self.client.chat.completions.create(**params)
 
             return self._process_non_stream_response(response)
 
@@ -467,17 +498,10 @@ class ChatParallelWeb(BaseChatModel):
         **kwargs: Any,
     ) -> Iterator[ChatGenerationChunk]:
         """Stream responses from Parallel's chat API."""
-        openai_messages = _prepare_messages(messages)
+        params = self._build_request_params(messages, stop, stream=True)
 
         with self._handle_errors():
-            stream = self.client.chat.completions.create(
-                model=self.model,
-                messages=cast(Any, openai_messages),
-                stream=True,
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-                stop=stop,
-            )
+            stream = self.client.chat.completions.create(**params)
 
             for chunk in stream:
                 chunk_result = self._process_stream_chunk(chunk, run_manager)
@@ -492,17 +516,10 @@ class ChatParallelWeb(BaseChatModel):
         **kwargs: Any,
     ) -> ChatResult:
         """Async generate a response using Parallel's chat API."""
-        openai_messages = _prepare_messages(messages)
+        params = self._build_request_params(messages, stop, stream=False)
 
         with self._handle_errors():
-            response = await self.async_client.chat.completions.create(
-                model=self.model,
-                messages=cast(Any, openai_messages),
-                stream=False,
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-                stop=stop,
-            )
+            response = await self.async_client.chat.completions.create(**params)
 
             return self._process_non_stream_response(response)
 
@@ -514,17 +531,10 @@ class ChatParallelWeb(BaseChatModel):
         **kwargs: Any,
     ) -> AsyncIterator[ChatGenerationChunk]:
         """Async stream responses from Parallel's chat API."""
-        openai_messages = _prepare_messages(messages)
+        params = self._build_request_params(messages, stop, stream=True)
 
         with self._handle_errors():
-            stream = await self.async_client.chat.completions.create(
-                model=self.model,
-                messages=cast(Any, openai_messages),
-                stream=True,
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-                stop=stop,
-            )
+            stream = await self.async_client.chat.completions.create(**params)
 
             async for chunk in stream:
                 chunk_result = await self._process_async_stream_chunk(
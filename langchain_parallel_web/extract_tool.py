@@ -2,17 +2,36 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional, Union
+import asyncio
+import functools
+from collections.abc import AsyncIterator, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional, TypedDict, Union
 
+import httpx
 from langchain_core.callbacks import (
     AsyncCallbackManagerForToolRun,
     CallbackManagerForToolRun,
 )
 from langchain_core.tools import BaseTool
-from pydantic import BaseModel, Field, SecretStr, model_validator
+from parallel import APIConnectionError
+from pydantic import BaseModel, Field, SecretStr, SkipValidation, model_validator
+
+from ._client import (
+    DEFAULT_MAX_RETRIES,
+    AsyncParallelExtractClient,
+    ParallelExtractClient,
+    ResponseCache,
+    TTLCache,
+    get_api_key,
+    get_async_extract_client,
+    get_extract_client,
+)
+from ._types import ExcerptSettings, FetchPolicy, FullContentSettings, dump_settings
 
-from ._client import get_api_key, get_async_extract_client, get_extract_client
-from ._types import ExcerptSettings, FetchPolicy, FullContentSettings
+# Transport failures are re-raised as-is so callers can retry on the original
+# type; APIConnectionError also covers the SDK's APITimeoutError
+_NETWORK_ERRORS = (APIConnectionError, httpx.TimeoutException, httpx.ConnectError)
 
 
 class ParallelExtractInput(BaseModel):
@@ -63,11 +82,140 @@ class ParallelExtractInput(BaseModel):
         default=None,
         description=(
             "Request timeout in seconds. If not specified, uses default of "
-            "5 seconds per URL."
+            "10 seconds plus 2 seconds per URL, capped at 120 seconds."
         ),
     )
 
 
+class _ExtractResult(TypedDict, total=False):
+    """One entry of the extract tool's output.
+
+    Entries are plain dicts, returned as-is to callers and serialized without
+    conversion; typing them lets mypy check the keys the formatters write.
+    Error entries set ``error_type`` and ``http_status_code`` instead of the
+    content fields.
+    """
+
+    url: Optional[str]
+    title: Optional[str]
+    content: str
+    excerpts: list[str]
+    full_content: str
+    publish_date: Optional[str]
+    error_type: Optional[str]
+    http_status_code: Optional[int]
+
+
+_MISSING = object()
+
+
+def _format_result(
+    result: dict[str, Any], *, keep_excerpts: bool = True
+) -> _ExtractResult:
+    """Format one extract result for the tool output.
+
+    With ``keep_excerpts`` off, the excerpt list is only returned joined into
+    ``content``, so the output does not hold the same text twice.
+    """
+    get = result.get
+    formatted_result: _ExtractResult = {"url": get("url"), "title": get("title")}
+    excerpts = get("excerpts")
+    full_content = get("full_content")
+
+    # Add excerpts if present, combined into the content field for backward
+    # compatibility. Excerpts are a list of strings, joined with blank lines,
+    # unless full_content is present, which overrides them as the content.
+    if excerpts is not None:
+        if keep_excerpts:
+            formatted_result["excerpts"] = excerpts
+        if full_content is None:
+            formatted_result["content"] = "\n\n".join(excerpts)
+
+    if full_content is not None:
+        formatted_result["full_content"] = full_content
+        formatted_result["content"] = full_content
+
+    # Add optional fields if present
+    publish_date = get("publish_date", _MISSING)
+    if publish_date is not _MISSING:
+        formatted_result["publish_date"] = publish_date
+
+    return formatted_result
+
+
+def _format_error(error: dict[str, Any]) -> _ExtractResult:
+    """Format one extract error for the tool output."""
+    get = error.get
+    return {
+        "url": get("url"),
+        "title": None,
+        "content": f"Error: {get('error_type') or 'Unknown error'}",
+        "error_type": get("error_type"),
+        "http_status_code": get("http_status_code"),
+    }
+
+
+def _describe_urls(count: int) -> str:
+    """Describe a URL count for callback messages, e.g. ``"3 URLs"``."""
+    return f"{count} URL{'s' if count != 1 else ''}"
+
+
+def _describe_outcome(result: list[_ExtractResult]) -> str:
+    """Summarize formatted extract results for the completion message."""
+    success_count = sum(1 for item in result if "error_type" not in item)
+    error_count = len(result) - success_count
+    if error_count > 0:
+        return f"{success_count} succeeded, {error_count} failed"
+    return f"{_describe_urls(success_count)} processed"
+
+
+def _split_batches(urls: list[str], batch_size: int) -> list[list[str]]:
+    """Split ``urls`` into consecutive batches of at most ``batch_size``."""
+    return [urls[i : i + batch_size] for i in range(0, len(urls), batch_size)]
+
+
+def _merge_extract_responses(responses: list[dict[str, Any]]) -> dict[str, Any]:
+    """Combine the responses of several sub-batch extract calls into one."""
+    return {
+        "results": [
+            result for response in responses for result in response.get("results") or []
+        ],
+        "errors": [
+            error for response in responses for error in response.get("errors") or []
+        ],
+    }
+
+
+def _iter_extract_results(
+    extract_response: dict[str, Any], urls: list[str], *, keep_excerpts: bool = True
+) -> Iterator[_ExtractResult]:
+    """Yield formatted results (and errors) lined up with the caller's URLs.
+
+    Every requested URL gets its own entry in request order, with repeated
+    URLs receiving separate copies. Entries for URLs that were not requested
+    verbatim (e.g. normalized by the API) come last. Each entry is formatted
+    only when it is yielded, so consumers can stream large batches without
+    holding a second copy of every result.
+    """
+    format_result = functools.partial(_format_result, keep_excerpts=keep_excerpts)
+    entries: list[tuple[Callable[[dict[str, Any]], _ExtractResult], dict[str, Any]]]
+    entries = [
+        *((format_result, result) for result in extract_response.get("results") or []),
+        *((_format_error, error) for error in extract_response.get("errors") or []),
+    ]
+    by_url = {item.get("url"): (format_item, item) for format_item, item in entries}
+    for url in urls:
+        entry = by_url.get(url)
+        if entry is not None:
+            format_item, item = entry
+            yield format_item(item)
+
+    requested = set(urls)
+    for format_item, item in entries:
+        if item.get("url") not in requested:
+            yield format_item(item)
+
+
 class ParallelExtractTool(BaseTool):
     """Parallel Extract Tool.
 
@@ -91,6 +239,27 @@ class ParallelExtractTool(BaseTool):
             Base URL for Parallel API. Defaults to "https://api.parallel.ai".
         max_chars_per_extract: Optional[int]
             Maximum characters per extracted result.
+        cache: Optional[MutableMapping[str, dict]]
+            Optional response cache. Repeated identical extractions are served
+            from it instead of the API.
+        cache_ttl: Optional[float]
+            If set and no ``cache`` is given, cache responses in memory for
+            this many seconds.
+        max_retries: int
+            Max number of retries for transient failures. Defaults to 2.
+        max_batch_size: int
+            Maximum URLs per API request; larger lists are split into
+            sub-batches. Defaults to 10.
+        max_workers: int
+            Maximum sub-batches extracted concurrently. Defaults to 8.
+        batch_window: Optional[float]
+            If set, concurrent async calls with the same settings made within
+            this many seconds are combined into one API request. URLs the API
+            returns in another form are re-sent on their own. Defaults to None
+            (no batching).
+        keep_raw_excerpts: bool
+            Whether results include the ``excerpts`` list alongside the joined
+            ``content``. Defaults to True.
 
     Instantiation:
         .. code-block:: python
@@ -123,12 +292,29 @@ class ParallelExtractTool(BaseTool):
                 print(f"URL: {item['url']}")
                 print(f"Content: {item['content'][:200]}...")
 
+    Streaming:
+        .. code-block:: python
+
+            # Handle results one at a time instead of as one list
+            for item in tool.iter_extract(urls):
+                store.add(item["content"])
+
+            async for item in tool.aiter_extract(urls):
+                await store.aadd(item["content"])
+
     Response Format:
         Returns a list of dictionaries, each containing:
         - url: The URL that was extracted
         - title: Title of the webpage
         - content: Full extracted content as markdown
         - publish_date: Publish date if available (optional)
+
+    Errors:
+        Timeouts and connection failures are raised as-is so callers can retry
+        them: ``parallel.APITimeoutError`` / ``parallel.APIConnectionError``
+        from the SDK, or ``httpx.TimeoutException`` / ``httpx.ConnectError``.
+        Any other failure is raised as a ``ValueError``. Per-URL failures are
+        not raised; they are returned as entries with an ``error_type``.
     """
 
     name: str = "parallel_extract"
@@ -148,119 +334,266 @@ class ParallelExtractTool(BaseTool):
     max_chars_per_extract: Optional[int] = None
     """Maximum characters per extracted result."""
 
+    cache: SkipValidation[Optional[ResponseCache]] = Field(default=None, exclude=True)
+    """Optional mapping used to cache API responses. Identical requests are
+    served from the cache instead of the network. Any mutable mapping works,
+    e.g. a ``dict``, a ``TTLCache`` or a ``diskcache.Cache``. Requests whose
+    fetch policy sets ``disable_cache_fallback`` always bypass it."""
+
+    cache_ttl: Optional[float] = None
+    """If set and no ``cache`` is given, responses are cached in an in-memory
+    ``TTLCache`` for this many seconds."""
+
+    max_retries: int = Field(default=DEFAULT_MAX_RETRIES)
+    """Max number of retries for connection errors, timeouts, rate limits and
+    server errors. Retries back off exponentially with jitter; other client
+    errors are never retried."""
+
+    max_batch_size: int = Field(default=10, gt=0)
+    """Maximum number of URLs sent in one API request. Longer URL lists are
+    split into sub-batches that are extracted concurrently, so one slow batch
+    does not hold up the rest."""
+
+    max_workers: int = Field(default=8, gt=0)
+    """Maximum number of sub-batches extracted at once, as threads for sync
+    calls and as concurrent requests for async ones."""
+
+    batch_window: Optional[float] = Field(default=None, gt=0)
+    """If set, async calls made within this many seconds of each other that
+    share the same settings are sent together as one API request of up to
+    ``max_batch_size`` URLs, and each call gets back its own URLs' results.
+    Results are matched to calls by URL, so a URL the API returns under a
+    different form (e.g. normalized) is re-sent in a request of its own, which
+    costs one extra request. Useful when many agent steps extract one or two
+    URLs at a time. Sync calls are never batched."""
+
+    keep_raw_excerpts: bool = True
+    """Whether each result keeps its ``excerpts`` list in addition to the
+    ``content`` string they are joined into. Turn off for large batches to
+    avoid returning the excerpt text twice."""
+
+    _api_key_str: str = ""
+    """API key resolved during validation."""
+
+    _full_content_config: Optional[dict[str, Any]] = None
+    """Tool-level full_content settings, built once from max_chars_per_extract."""
+
     _client: Any = None
-    """Synchronous extract client (initialized after validation)."""
+    """Synchronous extract client (created on first use)."""
 
     _async_client: Any = None
-    """Asynchronous extract client (initialized after validation)."""
+    """Asynchronous extract client (created on first use)."""
 
     @model_validator(mode="after")
     def validate_environment(self) -> ParallelExtractTool:
-        """Validate the environment and initialize clients."""
-        # Get API key from parameter or environment
-        api_key_str = get_api_key(
+        """Validate the environment."""
+        # Get API key from parameter or environment, so a missing key fails
+        # at construction rather than on first use
+        self._api_key_str = get_api_key(
             self.api_key.get_secret_value() if self.api_key else None
         )
 
-        # Initialize both sync and async clients once
-        self._client = get_extract_client(api_key_str, self.base_url)
-        self._async_client = get_async_extract_client(api_key_str, self.base_url)
+        if self.cache is None and self.cache_ttl is not None:
+            self.cache = TTLCache(ttl=self.cache_ttl)
+
+        # Fixed for the tool's lifetime, so build it once instead of per call
+        if self.max_chars_per_extract:
+            self._full_content_config = {
+                "max_chars_per_result": self.max_chars_per_extract
+            }
 
         return self
 
+    def _get_client(self) -> ParallelExtractClient:
+        """Return the sync client, creating it on first use."""
+        # Built once per tool and then reused, so its connection pool stays
+        # warm across invocations; tools used only async never build one
+        if self._client is None:
+            self._client = get_extract_client(
+                self._api_key_str,
+                self.base_url,
+                cache=self.cache,
+                max_retries=self.max_retries,
+            )
+        return self._client
+
+    def _get_async_client(self) -> AsyncParallelExtractClient:
+        """Return the async client, creating it on first use."""
+        if self._async_client is None:
+            self._async_client = get_async_extract_client(
+                self._api_key_str,
+                self.base_url,
+                cache=self.cache,
+                max_retries=self.max_retries,
+                batch_window=self.batch_window,
+                max_batch_size=self.max_batch_size,
+            )
+        return self._async_client
+
     def _prepare_extract_params(
         self,
         excerpts: Union[bool, ExcerptSettings],
         full_content: Union[bool, FullContentSettings],
-        fetch_policy: Optional[FetchPolicy],
+        fetch_policy: Optional[Union[FetchPolicy, dict[str, Any]]],
     ) -> tuple[Any, Any, Optional[dict[str, Any]]]:
         """Prepare parameters for extract API call.
 
         Args:
             excerpts: Include excerpts (boolean or ExcerptSettings)
             full_content: Include full content (boolean or FullContentSettings)
-            fetch_policy: Optional fetch policy for cache vs live content
+            fetch_policy: Optional fetch policy for cache vs live content, as a
+                FetchPolicy or an equivalent dict
 
         Returns:
             Tuple of (excerpts_param, full_content_param, fetch_policy_param)
         """
         # Build full_content config
         full_content_param = full_content
-        if self.max_chars_per_extract and isinstance(full_content, bool):
+        if self._full_content_config and isinstance(full_content, bool):
             # Use tool-level config if full_content is just a boolean
-            full_content_param = {"max_chars_per_result": self.max_chars_per_extract}
+            full_content_param = self._full_content_config
         elif isinstance(full_content, FullContentSettings):
-            full_content_param = full_content.model_dump(exclude_none=True)
+            full_content_param = dump_settings(full_content)
 
         # Build excerpts config
         excerpts_param = excerpts
         if isinstance(excerpts, ExcerptSettings):
-            excerpts_param = excerpts.model_dump(exclude_none=True)
+            excerpts_param = dump_settings(excerpts)
 
         # Build fetch_policy config
         fetch_policy_param = None
         if fetch_policy:
-            fetch_policy_param = fetch_policy.model_dump(exclude_none=True)
+            fetch_policy_param = dump_settings(fetch_policy)
 
         return excerpts_param, full_content_param, fetch_policy_param
 
-    def _format_extract_response(
-        self, extract_response: dict[str, Any]
-    ) -> list[dict[str, Any]]:
-        """Format the extract API response.
+    def _build_extract_kwargs(
+        self,
+        search_objective: Optional[str],
+        search_queries: Optional[list[str]],
+        excerpts: Union[bool, ExcerptSettings],
+        full_content: Union[bool, FullContentSettings],
+        fetch_policy: Optional[Union[FetchPolicy, dict[str, Any]]],
+    ) -> dict[str, Any]:
+        """Build the client ``extract`` kwargs shared by sync and async runs.
+
+        ``urls`` and ``timeout`` are left for the caller to add.
+        """
+        excerpts_param, full_content_param, fetch_policy_param = (
+            self._prepare_extract_params(excerpts, full_content, fetch_policy)
+        )
+        return {
+            "objective": search_objective,
+            "search_queries": search_queries,
+            "excerpts": excerpts_param,
+            "full_content": full_content_param,
+            "fetch_policy": fetch_policy_param,
+        }
+
+    def iter_extract(
+        self,
+        urls: list[str],
+        search_objective: Optional[str] = None,
+        search_queries: Optional[list[str]] = None,
+        excerpts: Union[bool, ExcerptSettings] = True,
+        full_content: Union[bool, FullContentSettings] = False,
+        fetch_policy: Optional[Union[FetchPolicy, dict[str, Any]]] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[_ExtractResult]:
+        """Extract content from URLs, yielding one formatted result at a time.
+
+        Results are formatted as they are consumed, so large batches can be
+        streamed (e.g. into a vector store) without building the full list.
+        Unlike ``invoke``, no callbacks run and API errors propagate as-is.
 
         Args:
-            extract_response: Raw response from the extract API
+            urls: List of URLs to extract content from
+            search_objective: Optional search objective to focus extraction
+            search_queries: Optional keyword search queries to focus extraction
+            excerpts: Include excerpts (boolean or ExcerptSettings)
+            full_content: Include full content (boolean or FullContentSettings)
+            fetch_policy: Optional fetch policy for cache vs live content, as a
+                FetchPolicy or an equivalent dict
+            timeout: Request timeout in seconds
 
-        Returns:
-            List of formatted result dictionaries
+        Yields:
+            Result dictionaries in the same format and order as ``invoke``
         """
-        results = extract_response.get("results", [])
-        errors = extract_response.get("errors", [])
-
-        # Format results
-        formatted_results = []
-        for result in results:
-            formatted_result = {
-                "url": result.get("url"),
-                "title": result.get("title"),
-            }
+        client = self._get_client()
+        kwargs = self._build_extract_kwargs(
+            search_objective, search_queries, excerpts, full_content, fetch_policy
+        )
 
-            # Add excerpts if present
-            if "excerpts" in result and result["excerpts"] is not None:
-                formatted_result["excerpts"] = result["excerpts"]
-                # Combine excerpts into content field for backward compatibility
-                # Excerpts are a list of strings, join them with newlines
-                formatted_result["content"] = "\n\n".join(result["excerpts"])
-
-            # Add full_content if present and not None
-            # (overrides excerpts-based content)
-            if "full_content" in result and result["full_content"] is not None:
-                formatted_result["full_content"] = result["full_content"]
-                # For backward compatibility, also set as "content"
-                formatted_result["content"] = result["full_content"]
-
-            # Add optional fields if present
-            if "publish_date" in result:
-                formatted_result["publish_date"] = result["publish_date"]
-
-            formatted_results.append(formatted_result)
-
-        # If there were errors, add them to the results with error info
-        formatted_results.extend(
-            [
-                {
-                    "url": error.get("url"),
-                    "title": None,
-                    "content": f"Error: {error.get('error_type', 'Unknown error')}",
-                    "error_type": error.get("error_type"),
-                    "http_status_code": error.get("http_status_code"),
-                }
-                for error in errors
-            ]
+        def extract_batch(batch: list[str]) -> dict[str, Any]:
+            return client.extract(urls=batch, timeout=timeout, **kwargs)
+
+        # Fetch each distinct URL once, in sub-batches sent concurrently
+        unique_urls = list(dict.fromkeys(urls))
+        batches = _split_batches(unique_urls, self.max_batch_size)
+        if len(batches) <= 1:
+            # One request, which also lets the client reject an empty list
+            extract_response = extract_batch(unique_urls)
+        else:
+            workers = min(self.max_workers, len(batches))
+            executor = ThreadPoolExecutor(max_workers=workers)
+            try:
+                responses = list(executor.map(extract_batch, batches))
+            except BaseException:
+                # One failed batch fails the call, so drop the batches not yet
+                # started instead of waiting for them
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+            executor.shutdown()
+            extract_response = _merge_extract_responses(responses)
+        yield from _iter_extract_results(
+            extract_response, urls, keep_excerpts=self.keep_raw_excerpts
         )
 
-        return formatted_results
+    async def aiter_extract(
+        self,
+        urls: list[str],
+        search_objective: Optional[str] = None,
+        search_queries: Optional[list[str]] = None,
+        excerpts: Union[bool, ExcerptSettings] = True,
+        full_content: Union[bool, FullContentSettings] = False,
+        fetch_policy: Optional[Union[FetchPolicy, dict[str, Any]]] = None,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[_ExtractResult]:
+        """Async counterpart of ``iter_extract``.
+
+        Yields:
+            Result dictionaries in the same format and order as ``ainvoke``
+        """
+        client = self._get_async_client()
+        kwargs = self._build_extract_kwargs(
+            search_objective, search_queries, excerpts, full_content, fetch_policy
+        )
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def extract_batch(batch: list[str]) -> dict[str, Any]:
+            async with semaphore:
+                return await client.extract(urls=batch, timeout=timeout, **kwargs)
+
+        # Fetch each distinct URL once, in sub-batches sent concurrently
+        unique_urls = list(dict.fromkeys(urls))
+        batches = _split_batches(unique_urls, self.max_batch_size)
+        if len(batches) <= 1:
+            # One request, which also lets the client reject an empty list
+            extract_response = await extract_batch(unique_urls)
+        else:
+            tasks = [asyncio.ensure_future(extract_batch(batch)) for batch in batches]
+            try:
+                responses = await asyncio.gather(*tasks)
+            except BaseException:
+                # One failed batch fails the call, so stop sending the rest
+                for task in tasks:
+                    task.cancel()
+                raise
+            extract_response = _merge_extract_responses(responses)
+        for item in _iter_extract_results(
+            extract_response, urls, keep_excerpts=self.keep_raw_excerpts
+        ):
+            yield item
 
     def _run(
         self,
@@ -272,7 +605,7 @@ class ParallelExtractTool(BaseTool):
         fetch_policy: Optional[FetchPolicy] = None,
         timeout: Optional[float] = None,
         run_manager: Optional[CallbackManagerForToolRun] = None,
-    ) -> list[dict[str, Any]]:
+    ) -> list[_ExtractResult]:
         """Extract content from URLs.
 
         Args:
@@ -282,63 +615,58 @@ class ParallelExtractTool(BaseTool):
             excerpts: Include excerpts (boolean or ExcerptSettings)
             full_content: Include full content (boolean or FullContentSettings)
             fetch_policy: Optional fetch policy for cache vs live content
-            timeout: Request timeout in seconds (defaults to 5 seconds per URL)
+            timeout: Request timeout in seconds (defaults to 10 seconds plus
+                2 seconds per URL, capped at 120 seconds)
             run_manager: Callback manager for the tool run
 
         Returns:
             List of dictionaries with extracted content
+
+        Raises:
+            parallel.APIConnectionError: If the API could not be reached or the
+                request timed out (``parallel.APITimeoutError``)
+            httpx.TimeoutException: If the request timed out in the transport
+            httpx.ConnectError: If no connection could be made
+            ValueError: For any other failure, wrapping the original error
         """
         # Notify callback manager about extraction start
         if run_manager:
-            url_count = len(urls)
-            url_desc = f"{url_count} URL{'s' if url_count != 1 else ''}"
             run_manager.on_text(
-                f"Starting content extraction from {url_desc}\n", color="blue"
+                f"Starting content extraction from {_describe_urls(len(urls))}\n",
+                color="blue",
             )
 
         try:
-            # Prepare parameters for the extract API call
-            excerpts_param, full_content_param, fetch_policy_param = (
-                self._prepare_extract_params(excerpts, full_content, fetch_policy)
-            )
-
             # Notify about extraction execution
             if run_manager:
                 run_manager.on_text("Executing extraction...\n", color="yellow")
 
-            # Extract content from URLs using the pre-initialized client
-            extract_response = self._client.extract(
-                urls=urls,
-                objective=search_objective,
-                search_queries=search_queries,
-                excerpts=excerpts_param,
-                full_content=full_content_param,
-                fetch_policy=fetch_policy_param,
-                timeout=timeout,
+            # Extract content from URLs using the tool's client
+            result = list(
+                self.iter_extract(
+                    urls,
+                    search_objective=search_objective,
+                    search_queries=search_queries,
+                    excerpts=excerpts,
+                    full_content=full_content,
+                    fetch_policy=fetch_policy,
+                    timeout=timeout,
+                )
             )
 
-            # Format and return the response
-            result = self._format_extract_response(extract_response)
-
             # Notify callback manager about completion
             if run_manager:
-                success_count = sum(1 for item in result if "error_type" not in item)
-                error_count = len(result) - success_count
-                if error_count > 0:
-                    run_manager.on_text(
-                        f"Extraction completed: {success_count} succeeded, "
-                        f"{error_count} failed\n",
-                        color="green",
-                    )
-                else:
-                    url_text = "URL" if success_count == 1 else "URLs"
-                    run_manager.on_text(
-                        f"Extraction completed: {success_count} {url_text} processed\n",
-                        color="green",
-                    )
+                run_manager.on_text(
+                    f"Extraction completed: {_describe_outcome(result)}\n",
+                    color="green",
+                )
 
             return result
 
+        except _NETWORK_ERRORS as e:
+            if run_manager:
+                run_manager.on_text(f"Extraction failed: {e!s}\n", color="red")
+            raise
         except Exception as e:
             # Notify callback manager about error
             if run_manager:
@@ -356,7 +684,7 @@ class ParallelExtractTool(BaseTool):
         fetch_policy: Optional[FetchPolicy] = None,
         timeout: Optional[float] = None,
         run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
-    ) -> list[dict[str, Any]]:
+    ) -> list[_ExtractResult]:
         """Extract content from URLs asynchronously.
 
         Args:
@@ -366,66 +694,63 @@ class ParallelExtractTool(BaseTool):
             excerpts: Include excerpts (boolean or ExcerptSettings)
             full_content: Include full content (boolean or FullContentSettings)
             fetch_policy: Optional fetch policy for cache vs live content
-            timeout: Request timeout in seconds (defaults to 5 seconds per URL)
+            timeout: Request timeout in seconds (defaults to 10 seconds plus
+                2 seconds per URL, capped at 120 seconds)
             run_manager: Async callback manager for the tool run
 
         Returns:
             List of dictionaries with extracted content
+
+        Raises:
+            parallel.APIConnectionError: If the API could not be reached or the
+                request timed out (``parallel.APITimeoutError``)
+            httpx.TimeoutException: If the request timed out in the transport
+            httpx.ConnectError: If no connection could be made
+            ValueError: For any other failure, wrapping the original error
         """
         # Notify callback manager about extraction start
         if run_manager:
-            url_count = len(urls)
-            url_desc = f"{url_count} URL{'s' if url_count != 1 else ''}"
             await run_manager.on_text(
-                f"Starting async content extraction from {url_desc}\n", color="blue"
+                f"Starting async content extraction from {_describe_urls(len(urls))}\n",
+                color="blue",
             )
 
         try:
-            # Prepare parameters for the extract API call
-            excerpts_param, full_content_param, fetch_policy_param = (
-                self._prepare_extract_params(excerpts, full_content, fetch_policy)
-            )
-
             # Notify about extraction execution
             if run_manager:
                 await run_manager.on_text(
                     "Executing async extraction...\n", color="yellow"
                 )
 
-            # Extract content from URLs using the pre-initialized async client
-            extract_response = await self._async_client.extract(
-                urls=urls,
-                objective=search_objective,
-                search_queries=search_queries,
-                excerpts=excerpts_param,
-                full_content=full_content_param,
-                fetch_policy=fetch_policy_param,
-                timeout=timeout,
-            )
-
-            # Format and return the response
-            result = self._format_extract_response(extract_response)
+            # Extract content from URLs using the tool's async client
+            result = [
+                item
+                async for item in self.aiter_extract(
+                    urls,
+                    search_objective=search_objective,
+                    search_queries=search_queries,
+                    excerpts=excerpts,
+                    full_content=full_content,
+                    fetch_policy=fetch_policy,
+                    timeout=timeout,
+                )
+            ]
 
             # Notify callback manager about completion
             if run_manager:
-                success_count = sum(1 for item in result if "error_type" not in item)
-                error_count = len(result) - success_count
-                if error_count > 0:
-                    await run_manager.on_text(
-                        f"Async extraction completed: {success_count} succeeded, "
-                        f"{error_count} failed\n",
-                        color="green",
-                    )
-                else:
-                    url_text = "URL" if success_count == 1 else "URLs"
-                    await run_manager.on_text(
-                        f"Async extraction completed: {success_count} {url_text} "
-                        f"processed\n",
-                        color="green",
-                    )
+                await run_manager.on_text(
+                    f"Async extraction completed: {_describe_outcome(result)}\n",
+                    color="green",
+                )
 
             return result
 
+        except _NETWORK_ERRORS as e:
+            if run_manager:
+                await run_manager.on_text(
+                    f"Async extraction failed: {e!s}\n", color="red"
+                )
+            raise
         except Exception as e:
             # Notify callback manager about error
             if run_manager:
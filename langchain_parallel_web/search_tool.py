@@ -10,10 +10,16 @@ from langchain_core.callbacks import (
     CallbackManagerForToolRun,
 )
 from langchain_core.tools import BaseTool
-from pydantic import BaseModel, Field, SecretStr, model_validator
-
-from ._client import get_api_key, get_async_search_client, get_search_client
-from ._types import ExcerptSettings, FetchPolicy
+from pydantic import BaseModel, Field, SecretStr, SkipValidation, model_validator
+
+from ._client import (
+    DEFAULT_MAX_RETRIES,
+    ResponseCache,
+    get_api_key,
+    get_async_search_client,
+    get_search_client,
+)
+from ._types import ExcerptSettings, FetchPolicy, dump_settings
 
 
 class ParallelWebSearchInput(BaseModel):
@@ -98,6 +104,15 @@ class ParallelWebSearchTool(BaseTool):
             PARALLEL_API_KEY env var.
         base_url: str
             Base URL for Parallel API. Defaults to "https://api.parallel.ai".
+        cache: Optional[MutableMapping[str, dict]]
+            Optional response cache. Repeated identical searches are served
+            from it instead of the API.
+        max_retries: int
+            Max number of retries for transient failures. Defaults to 2.
+        default_timeout: Optional[float]
+            Default request timeout in seconds. Defaults to a per-mode value.
+        timeouts_by_mode: Optional[dict[str, float]]
+            Default request timeouts keyed by search mode.
 
     Instantiation:
         .. code-block:: python
@@ -241,6 +256,24 @@ class ParallelWebSearchTool(BaseTool):
     base_url: str = Field(default="https://api.parallel.ai")
     """Base URL for Parallel API."""
 
+    cache: SkipValidation[Optional[ResponseCache]] = Field(default=None, exclude=True)
+    """Optional mapping used to cache API responses. Identical requests are
+    served from the cache instead of the network. Any mutable mapping works,
+    e.g. a ``dict``, a ``TTLCache`` or a ``diskcache.Cache``."""
+
+    max_retries: int = Field(default=DEFAULT_MAX_RETRIES)
+    """Max number of retries for connection errors, timeouts, rate limits and
+    server errors. Retries back off exponentially with jitter; other client
+    errors are never retried."""
+
+    default_timeout: Optional[float] = None
+    """Default request timeout in seconds for searches that do not pass one.
+    If not set, a per-mode default is used."""
+
+    timeouts_by_mode: Optional[dict[str, float]] = None
+    """Default request timeouts in seconds keyed by search mode, taking
+    precedence over ``default_timeout`` for the modes they name."""
+
     _client: Any = None
     """Synchronous search client (initialized after validation)."""
 
@@ -256,8 +289,22 @@ class ParallelWebSearchTool(BaseTool):
         )
 
         # Initialize both sync and async clients once
-        self._client = get_search_client(api_key_str, self.base_url)
-        self._async_client = get_async_search_client(api_key_str, self.base_url)
+        self._client = get_search_client(
+            api_key_str,
+            self.base_url,
+            cache=self.cache,
+            max_retries=self.max_retries,
+            default_timeout=self.default_timeout,
+            timeouts_by_mode=self.timeouts_by_mode,
+        )
+        self._async_client = get_async_search_client(
+            api_key_str,
+            self.base_url,
+            cache=self.cache,
+            max_retries=self.max_retries,
+            default_timeout=self.default_timeout,
+            timeouts_by_mode=self.timeouts_by_mode,
+        )
 
         return self
 
@@ -337,10 +384,8 @@ class ParallelWebSearchTool(BaseTool):
             run_manager.on_text(f"Starting web search: {query_desc}\n", color="blue")
 
         # Convert ExcerptSettings and FetchPolicy to dict if provided
-        excerpts_dict = excerpts.model_dump(exclude_none=True) if excerpts else None
-        fetch_policy_dict = (
-            fetch_policy.model_dump(exclude_none=True) if fetch_policy else None
-        )
+        excerpts_dict = dump_settings(excerpts) if excerpts else None
+        fetch_policy_dict = dump_settings(fetch_policy) if fetch_policy else None
 
         search_params = {
             "objective": objective,
@@ -435,10 +480,8 @@ class ParallelWebSearchTool(BaseTool):
             )
 
         # Convert ExcerptSettings and FetchPolicy to dict if provided
-        excerpts_dict = excerpts.model_dump(exclude_none=True) if excerpts else None
-        fetch_policy_dict = (
-            fetch_policy.model_dump(exclude_none=True) if fetch_policy else None
-        )
+        excerpts_dict = dump_settings(excerpts) if excerpts else None
+        fetch_policy_dict = dump_settings(fetch_policy) if fetch_policy else None
 
         search_params = {
             "objective": objective,
@@ -1,9 +1,39 @@
 from __future__ import annotations
 
 import importlib.util
+import multiprocessing
 import os
 import sys
 import traceback
+from concurrent.futures import ProcessPoolExecutor
+
+CLIENT_FILE = "langchain_parallel_web/_client.py"
+
+# Files imported so far in this process. Where the platform supports it,
+# workers are forked after the parent has preloaded the shared client module,
+# so they inherit it and don't import it again.
+_loaded_modules: set[str] = set()
+
+
+def _exec(module_name: str, file: str, *, register: bool) -> None:
+    """Create a module for ``file`` and execute it.
+
+    With ``register`` set, the module is added to ``sys.modules`` before it
+    runs (so relative imports resolve) and removed again if it fails.
+    """
+    spec = importlib.util.spec_from_file_location(module_name, file)
+    if not (spec and spec.loader):
+        msg = f"Cannot create spec for {file}"
+        raise ImportError(msg)
+    module = importlib.util.module_from_spec(spec)
+    if register:
+        sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        if register:
+            sys.modules.pop(module_name, None)
+        raise
 
 
 def load_module_with_deps(file: str, loaded_modules: set[str] | None = None) -> bool:
@@ -16,36 +46,35 @@ def load_module_with_deps(file: str, loaded_modules: set[str] | None = None) ->
 
     loaded_modules.add(file)
 
-    # Convert file path to module name for proper package context
-    if file.startswith("langchain_parallel_web/"):
-        module_name = file.replace("/", ".").replace(".py", "")
-
-        # Load _client first if this module depends on it
-        client_file = "langchain_parallel_web/_client.py"
-        if "_client" not in module_name and client_file not in loaded_modules:
-            try:
-                load_module_with_deps(client_file, loaded_modules)
-            except Exception:
-                pass  # Continue if _client fails
-
-        # Use importlib.util.spec_from_file_location with proper module name
-        spec = importlib.util.spec_from_file_location(module_name, file)
-        if spec and spec.loader:
-            module = importlib.util.module_from_spec(spec)
-            # Add to sys.modules before execution to support relative imports
-            sys.modules[module_name] = module
-            spec.loader.exec_module(module)
-            return True
-        msg = f"Cannot create spec for {file}"
-        raise ImportError(msg)
     # For files outside the package, use the old method
-    spec = importlib.util.spec_from_file_location("x", file)
-    if spec and spec.loader:
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
+    if not file.startswith("langchain_parallel_web/"):
+        _exec("x", file, register=False)
         return True
-    msg = f"Cannot create spec for {file}"
-    raise ImportError(msg)
+
+    # Convert file path to module name for proper package context; a module
+    # already imported (e.g. as another file's dependency) needs no new spec
+    module_name = file.replace("/", ".").replace(".py", "")
+    if module_name in sys.modules:
+        return True
+
+    # Load _client first if this module depends on it
+    if "_client" not in module_name and CLIENT_FILE not in loaded_modules:
+        try:
+            load_module_with_deps(CLIENT_FILE, loaded_modules)
+        except Exception:
+            pass  # Continue if _client fails
+
+    _exec(module_name, file, register=True)
+    return True
+
+
+def _check_file(file: str) -> str | None:
+    """Import ``file``, returning the formatted traceback if it fails."""
+    try:
+        load_module_with_deps(file, _loaded_modules)
+    except Exception:
+        return traceback.format_exc()
+    return None
 
 
 if __name__ == "__main__":
@@ -56,15 +85,35 @@ if __name__ == "__main__":
     if os.getcwd() not in sys.path:
         sys.path.insert(0, os.getcwd())
 
-    loaded_modules: set[str] = set()
+    # Only forked workers inherit what the parent has imported; spawn and
+    # forkserver workers start from a fresh interpreter
+    mp_context = None
+    if "fork" in multiprocessing.get_all_start_methods():
+        mp_context = multiprocessing.get_context("fork")
 
-    for file in files:
+        # Import the module every other one depends on once, before the
+        # workers start; a failure is left for the worker checking that file
+        # to report
+        preloaded: set[str] = set()
         try:
-            load_module_with_deps(file, loaded_modules)
+            load_module_with_deps(CLIENT_FILE, preloaded)
         except Exception:
+            pass
+        else:
+            _loaded_modules.update(preloaded)
+
+    # Files are independent, so import them in parallel worker processes
+    max_workers = min(len(files), os.cpu_count() or 1) or 1
+    with ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=mp_context
+    ) as executor:
+        errors = list(executor.map(_check_file, files))
+
+    for file, error in zip(files, errors):
+        if error is not None:
             has_failure = True
             print(file)  # noqa: T201
-            traceback.print_exc()
+            print(error, end="", file=sys.stderr)  # noqa: T201
             print()  # noqa: T201
 
     sys.exit(1 if has_failure else 0)
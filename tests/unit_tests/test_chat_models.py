@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
 from langchain_tests.unit_tests import ChatModelUnitTests
+from pydantic import SecretStr
 
-from langchain_parallel_web.chat_models import ChatParallelWeb
+from langchain_parallel_web.chat_models import (
+    ChatParallelWeb,
+    _merge_consecutive_messages,
+)
 
 
 class TestChatParallelWebUnit(ChatModelUnitTests):
@@ -124,3 +129,78 @@ class TestChatParallelWebUnit(ChatModelUnitTests):
                 "api_key": "test-env-api-key",
             },
         )
+
+    def test_merge_consecutive_messages_merges_runs(self) -> None:
+        """Test consecutive messages of the same type are merged."""
+        merged = _merge_consecutive_messages(
+            [
+                SystemMessage(content="system"),
+                HumanMessage(content="first"),
+                HumanMessage(content="second"),
+            ]
+        )
+
+        assert [type(message) for message in merged] == [SystemMessage, HumanMessage]
+        assert merged[1].content == "first\n\nsecond"
+
+    def test_merge_consecutive_messages_reuses_unmerged_messages(self) -> None:
+        """Test messages that need no merging are passed through unchanged."""
+        messages: list[BaseMessage] = [
+            SystemMessage(content="system"),
+            HumanMessage(content="question"),
+            AIMessage(content="answer"),
+        ]
+
+        merged = _merge_consecutive_messages(messages)
+
+        assert all(a is b for a, b in zip(merged, messages))
+
+    def test_request_params_omit_params_ignored_by_parallel(self) -> None:
+        """Test ignored sampling params are not sent to Parallel's API."""
+        llm = ChatParallelWeb(
+            api_key=SecretStr("test-api-key"), temperature=0.7, max_tokens=100
+        )
+
+        params = llm._build_request_params(
+            [HumanMessage(content="hi")], ["STOP"], stream=False
+        )
+
+        assert params == {
+            "model": "speed",
+            "messages": [{"role": "user", "content": "hi"}],
+            "stream": False,
+            "stop": ["STOP"],
+        }
+
+    def test_request_params_keep_set_params_for_other_endpoints(self) -> None:
+        """Test set params are forwarded to non-Parallel compatible endpoints."""
+        llm = ChatParallelWeb(
+            api_key=SecretStr("test-api-key"),
+            base_url="http://localhost:8000",
+            temperature=0.7,
+        )
+
+        params = llm._build_request_params(
+            [HumanMessage(content="hi")], None, stream=True
+        )
+
+        assert params["temperature"] == 0.7
+        assert "max_tokens" not in params
+        assert "stop" not in params
+
+    def test_client_params_forwarded_to_openai_clients(self) -> None:
+        """Test timeout and max_retries configure the underlying OpenAI clients."""
+        llm = ChatParallelWeb(
+            api_key=SecretStr("test-api-key"), timeout=5.0, max_retries=4
+        )
+
+        for client in (llm.client, llm.async_client):
+            assert client.timeout == 5.0
+            assert client.max_retries == 4
+
+    def test_async_client_built_on_first_use(self) -> None:
+        """Test the async client is created lazily and then reused."""
+        llm = ChatParallelWeb(api_key=SecretStr("test-api-key"))
+
+        assert llm._async_client is None
+        assert llm.async_client is llm.async_client
@@ -0,0 +1,769 @@
+"""Unit tests for Parallel API client wrappers."""
+
+import asyncio
+import json
+import threading
+from typing import Any, Callable
+from unittest.mock import AsyncMock, Mock
+
+import httpx
+import pytest
+from parallel import AsyncParallel, BadRequestError, Parallel
+
+from langchain_parallel_web._client import (
+    DEFAULT_SEARCH_TIMEOUT,
+    SEARCH_TIMEOUT_BY_MODE,
+    SHARED_POOL_LIMITS,
+    AsyncParallelExtractClient,
+    AsyncParallelSearchClient,
+    ParallelExtractClient,
+    ParallelSearchClient,
+    TTLCache,
+    _build_extract_kwargs,
+    _build_search_kwargs,
+    _get_extract_timeout,
+    _get_search_timeout,
+    _warm_connection,
+    get_api_key,
+    get_extract_client,
+    get_openai_client,
+    get_search_client,
+)
+
+
+def _json_handler(
+    payload: dict[str, Any], requests: list[httpx.Request]
+) -> Callable[[httpx.Request], httpx.Response]:
+    """Build a mock transport handler that records requests."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=payload)
+
+    return handler
+
+
+def _sdk_client(handler: Callable[[httpx.Request], httpx.Response]) -> Parallel:
+    """Build a Parallel SDK client served by a mock transport."""
+    return Parallel(
+        api_key="test-key",
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+
+
+def _async_sdk_client(
+    handler: Callable[[httpx.Request], httpx.Response],
+) -> AsyncParallel:
+    """Build an async Parallel SDK client served by a mock transport."""
+    return AsyncParallel(
+        api_key="test-key",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+
+class TestParallelSearchClient:
+    """Test cases for ParallelSearchClient."""
+
+    def test_context_manager_closes_client(self) -> None:
+        """Test the client closes its connection pool on context exit."""
+        with ParallelSearchClient(api_key="test-key") as client:
+            client.client = Mock()
+            sdk_client = client.client
+
+        sdk_client.close.assert_called_once()
+
+    def test_http2_enabled(self) -> None:
+        """Test the connection pool negotiates HTTP/2 when h2 is installed."""
+        pytest.importorskip("h2")
+        client = ParallelSearchClient(api_key="test-key")
+
+        transport = client.client._client._transport
+        assert transport._pool._http2 is True  # type: ignore[attr-defined]
+
+    def test_search_decodes_raw_response(self) -> None:
+        """Test the JSON body is returned as sent by the API."""
+        payload = {
+            "search_id": "search-123",
+            "results": [{"url": "https://example.com", "excerpts": ["Excerpt"]}],
+        }
+        requests: list[httpx.Request] = []
+        client = ParallelSearchClient(api_key="test-key")
+        client.client = _sdk_client(_json_handler(payload, requests))
+
+        result = client.search(objective="test", mode="agentic")
+
+        assert result == payload
+        assert json.loads(requests[0].content) == {
+            "objective": "test",
+            "search_queries": None,
+            "max_results": 10,
+            "mode": "agentic",
+        }
+
+    def test_warm_opens_connection_in_background(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test warm=True primes the connection pool off the calling thread."""
+        warmed = threading.Event()
+        calls: list[tuple[Any, str, str]] = []
+
+        def fake_warm(http_client: Any, url: str) -> None:
+            calls.append((http_client, url, threading.current_thread().name))
+            warmed.set()
+
+        monkeypatch.setattr(
+            "langchain_parallel_web._client._warm_connection", fake_warm
+        )
+        client = ParallelSearchClient(
+            api_key="test-key", base_url="https://example.com/", warm=True
+        )
+
+        assert warmed.wait(timeout=5)
+        http_client, url, thread_name = calls[0]
+        assert http_client is client.client._client
+        assert url == "https://example.com"
+        assert thread_name != threading.current_thread().name
+
+    def test_warm_failures_are_ignored(self) -> None:
+        """Test a failed warm-up request does not raise."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            msg = "unreachable"
+            raise httpx.ConnectError(msg, request=request)
+
+        _warm_connection(
+            httpx.Client(transport=httpx.MockTransport(handler)),
+            "https://example.com",
+        )
+
+
+class TestAsyncParallelSearchClient:
+    """Test cases for AsyncParallelSearchClient."""
+
+    async def test_async_context_manager_closes_client(self) -> None:
+        """Test the async client closes its connection pool on context exit."""
+        async with AsyncParallelSearchClient(api_key="test-key") as client:
+            client.client = Mock(close=AsyncMock())
+            sdk_client = client.client
+
+        sdk_client.close.assert_awaited_once()
+
+    async def test_pool_keeps_fan_out_connections_alive(self) -> None:
+        """Test the async pool uses the shared keep-alive limits."""
+        client = AsyncParallelSearchClient(api_key="test-key")
+
+        pool = client.client._client._transport._pool  # type: ignore[attr-defined]
+        assert pool._max_connections == SHARED_POOL_LIMITS.max_connections
+        assert (
+            pool._max_keepalive_connections
+            == SHARED_POOL_LIMITS.max_keepalive_connections
+        )
+        await client.aclose()
+
+    async def test_warm_deferred_to_context_entry(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test warming waits for a running loop and then runs as a task."""
+        warm = AsyncMock()
+        monkeypatch.setattr("langchain_parallel_web._client._awarm_connection", warm)
+
+        def build() -> AsyncParallelSearchClient:
+            return AsyncParallelSearchClient(api_key="test-key", warm=True)
+
+        # Constructed outside the event loop, so nothing can be scheduled yet
+        client = await asyncio.to_thread(build)
+        assert client._warm_task is None
+
+        async with client:
+            assert client._warm_task is not None
+            await client._warm_task
+
+        warm.assert_awaited_once_with(client.client._client, "https://api.parallel.ai")
+
+    async def test_concurrent_searches_share_client(self) -> None:
+        """Test concurrent searches fan out over the same SDK client."""
+        requests: list[httpx.Request] = []
+        client = AsyncParallelSearchClient(api_key="test-key")
+        client.client = _async_sdk_client(_json_handler({"results": []}, requests))
+
+        results = await asyncio.gather(
+            *(client.search(objective=f"query {i}") for i in range(3))
+        )
+
+        assert results == [{"results": []}] * 3
+        assert len(requests) == 3
+
+    async def test_max_concurrency_limits_in_flight_requests(self) -> None:
+        """Test no more than max_concurrency searches are sent at once."""
+        in_flight = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={"results": []})
+
+        client = AsyncParallelSearchClient(api_key="test-key", max_concurrency=2)
+        client.client = AsyncParallel(
+            api_key="test-key",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+
+        await asyncio.gather(*(client.search(objective=f"q{i}") for i in range(5)))
+
+        assert peak == 2
+
+    async def test_concurrent_identical_searches_coalesce(self) -> None:
+        """Test identical in-flight searches share a single request."""
+        requests: list[httpx.Request] = []
+        client = AsyncParallelSearchClient(api_key="test-key")
+        client.client = _async_sdk_client(_json_handler({"results": []}, requests))
+
+        results = await asyncio.gather(
+            *(client.search(objective="same query") for _ in range(3))
+        )
+
+        assert len(requests) == 1
+        assert results == [{"results": []}] * 3
+        # Each caller gets its own copy to annotate
+        assert results[0] is not results[1]
+        assert client._inflight == {}
+
+    async def test_coalesced_failure_raised_for_every_caller(self) -> None:
+        """Test a failed shared request is raised to all waiting callers."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(400, json={"error": "bad request"})
+
+        client = AsyncParallelSearchClient(api_key="test-key")
+        client.client = _async_sdk_client(handler)
+
+        results = await asyncio.gather(
+            *(client.search(objective="same query") for _ in range(3)),
+            return_exceptions=True,
+        )
+
+        assert len(requests) == 1
+        assert all(isinstance(result, BadRequestError) for result in results)
+        assert client._inflight == {}
+
+    async def test_cancelled_initiator_does_not_cancel_waiters(self) -> None:
+        """Test cancelling the first caller leaves the shared request running."""
+        requests: list[httpx.Request] = []
+        release = asyncio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            await release.wait()
+            return httpx.Response(200, json={"results": []})
+
+        client = AsyncParallelSearchClient(api_key="test-key")
+        client.client = AsyncParallel(
+            api_key="test-key",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+
+        initiator = asyncio.create_task(client.search(objective="same query"))
+        await asyncio.sleep(0.01)
+        waiter = asyncio.create_task(client.search(objective="same query"))
+        await asyncio.sleep(0.01)
+        initiator.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await waiter == {"results": []}
+        assert initiator.cancelled()
+        assert len(requests) == 1
+        assert client._inflight == {}
+
+
+class TestParallelExtractClient:
+    """Test cases for ParallelExtractClient."""
+
+    def test_extract_decodes_raw_response(self) -> None:
+        """Test the JSON body is returned as sent, without SDK defaults."""
+        payload = {
+            "extract_id": "extract-123",
+            "results": [{"url": "https://example.com", "full_content": "Text"}],
+            "errors": [],
+        }
+        requests: list[httpx.Request] = []
+        client = ParallelExtractClient(api_key="test-key")
+        client.client = _sdk_client(_json_handler(payload, requests))
+
+        assert client.extract(urls=["https://example.com"]) == payload
+
+
+class TestAsyncParallelExtractClient:
+    """Test cases for AsyncParallelExtractClient."""
+
+    @staticmethod
+    def _extract_handler(
+        requests: list[httpx.Request],
+    ) -> Callable[[httpx.Request], httpx.Response]:
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            urls = json.loads(request.content)["urls"]
+            return httpx.Response(
+                200,
+                json={
+                    "extract_id": "extract-123",
+                    "results": [{"url": url} for url in urls if "bad" not in url],
+                    "errors": [
+                        {"url": url, "error_type": "fetch_error"}
+                        for url in urls
+                        if "bad" in url
+                    ],
+                },
+            )
+
+        return handler
+
+    async def test_warm_scheduled_inside_running_loop(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test warming starts right away when a loop is already running."""
+        warm = AsyncMock()
+        monkeypatch.setattr("langchain_parallel_web._client._awarm_connection", warm)
+
+        async with AsyncParallelExtractClient(api_key="test-key", warm=True) as client:
+            assert client._warm_task is not None
+            await client._warm_task
+
+        warm.assert_awaited_once_with(client.client._client, "https://api.parallel.ai")
+
+    async def test_concurrent_extracts_batched(self) -> None:
+        """Test concurrent calls are sent together and split back by URL."""
+        requests: list[httpx.Request] = []
+        client = AsyncParallelExtractClient(api_key="test-key", batch_window=0.01)
+        client.client = _async_sdk_client(self._extract_handler(requests))
+
+        first, second = await asyncio.gather(
+            client.extract(urls=["https://a.com", "https://bad.com"]),
+            client.extract(urls=["https://b.com"]),
+        )
+
+        assert len(requests) == 1
+        assert json.loads(requests[0].content)["urls"] == [
+            "https://a.com",
+            "https://bad.com",
+            "https://b.com",
+        ]
+        assert [r["url"] for r in first["results"]] == ["https://a.com"]
+        assert [e["url"] for e in first["errors"]] == ["https://bad.com"]
+        assert [r["url"] for r in second["results"]] == ["https://b.com"]
+        assert second["errors"] == []
+
+    async def test_batched_normalized_urls_resent(self) -> None:
+        """Test URLs the API returns under another URL are fetched on their own."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            urls = json.loads(request.content)["urls"]
+            results = [{"url": url.rstrip("/")} for url in urls]
+            return httpx.Response(200, json={"results": results, "errors": []})
+
+        client = AsyncParallelExtractClient(api_key="test-key", batch_window=0.01)
+        client.client = _async_sdk_client(handler)
+
+        first, second = await asyncio.gather(
+            client.extract(urls=["https://a.com/", "https://c.com"]),
+            client.extract(urls=["https://b.com"]),
+        )
+
+        sent = [json.loads(request.content)["urls"] for request in requests]
+        assert sent == [
+            ["https://a.com/", "https://c.com", "https://b.com"],
+            ["https://a.com/"],
+        ]
+        assert [r["url"] for r in first["results"]] == [
+            "https://c.com",
+            "https://a.com",
+        ]
+        assert [r["url"] for r in second["results"]] == ["https://b.com"]
+
+    async def test_cancelled_batch_releases_callers(self) -> None:
+        """Test callers do not hang when their batch task is cancelled."""
+        sent = asyncio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            sent.set()
+            await asyncio.sleep(10)
+            return httpx.Response(200, json={"results": []})
+
+        client = AsyncParallelExtractClient(api_key="test-key", batch_window=0.01)
+        client.client = AsyncParallel(
+            api_key="test-key",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+
+        calls = [
+            asyncio.create_task(client.extract(urls=["https://a.com"])),
+            asyncio.create_task(client.extract(urls=["https://b.com"])),
+        ]
+        await sent.wait()
+        for task in client._batch_tasks:
+            task.cancel()
+
+        for call in calls:
+            with pytest.raises(asyncio.CancelledError):
+                await asyncio.wait_for(call, timeout=1)
+
+    async def test_aclose_cancels_pending_batches(self) -> None:
+        """Test aclose stops queued and in-flight batches before closing."""
+        requests: list[httpx.Request] = []
+        sent = asyncio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            sent.set()
+            await asyncio.sleep(10)
+            return httpx.Response(200, json={"results": []})
+
+        client = AsyncParallelExtractClient(
+            api_key="test-key", batch_window=10, max_batch_size=2
+        )
+        client.client = AsyncParallel(
+            api_key="test-key",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+
+        # A full batch is sent at once; the next call waits for its window
+        in_flight = asyncio.create_task(
+            client.extract(urls=["https://a.com", "https://b.com"])
+        )
+        await sent.wait()
+        queued = asyncio.create_task(client.extract(urls=["https://c.com"]))
+        await asyncio.sleep(0.01)
+
+        await client.aclose()
+
+        for call in (in_flight, queued):
+            with pytest.raises(asyncio.CancelledError):
+                await asyncio.wait_for(call, timeout=1)
+        assert len(requests) == 1
+        assert client._batches == {}
+        assert client._batch_tasks == set()
+
+    async def test_single_batched_call_gets_whole_response(self) -> None:
+        """Test a batch with one caller returns the response unsplit."""
+        requests: list[httpx.Request] = []
+        payload = {"results": [{"url": "https://a.com"}], "errors": []}
+        client = AsyncParallelExtractClient(api_key="test-key", batch_window=0.01)
+        client.client = _async_sdk_client(_json_handler(payload, requests))
+
+        result = await client.extract(urls=["https://a.com/"])
+
+        assert len(requests) == 1
+        assert result == payload
+
+    async def test_batches_split_by_settings_and_size(self) -> None:
+        """Test only calls with equal settings share a batch of bounded size."""
+        requests: list[httpx.Request] = []
+        client = AsyncParallelExtractClient(
+            api_key="test-key", batch_window=0.01, max_batch_size=2
+        )
+        client.client = _async_sdk_client(self._extract_handler(requests))
+
+        await asyncio.gather(
+            client.extract(urls=["https://a.com"]),
+            client.extract(urls=["https://b.com"]),
+            client.extract(urls=["https://c.com"]),
+            client.extract(urls=["https://d.com"], objective="other"),
+        )
+
+        sent = sorted(json.loads(request.content)["urls"] for request in requests)
+        assert sent == [
+            ["https://a.com", "https://b.com"],
+            ["https://c.com"],
+            ["https://d.com"],
+        ]
+
+
+class TestSharedClients:
+    """Test cases for SDK clients shared between client wrappers."""
+
+    def test_sync_factories_share_sdk_client(self) -> None:
+        """Test sync clients with the same settings share one connection pool."""
+        search_client = get_search_client("shared-key", "https://example.com")
+        extract_client = get_extract_client("shared-key", "https://example.com")
+        other_client = get_search_client("other-key", "https://example.com")
+
+        assert search_client.client is extract_client.client
+        assert other_client.client is not search_client.client
+
+    def test_closing_wrapper_keeps_shared_client_open(self) -> None:
+        """Test closing one wrapper does not close a pool others still use."""
+        with get_search_client("shared-key", "https://example.com") as client:
+            sdk_client = client.client
+
+        assert not sdk_client.is_closed()
+        assert get_search_client("shared-key", "https://example.com").client is (
+            sdk_client
+        )
+
+    def test_openai_client_shared(self) -> None:
+        """Test chat models with the same settings share one OpenAI client."""
+        first = get_openai_client("shared-key", "https://example.com")
+        second = get_openai_client("shared-key", "https://example.com")
+        tuned = get_openai_client("shared-key", "https://example.com", timeout=1.0)
+
+        assert first is second
+        assert tuned is not first
+
+    def test_shared_clients_use_one_http_pool(self) -> None:
+        """Test shared clients for any key send through one bounded pool."""
+        search_client = get_search_client("first-key", "https://example.com")
+        extract_client = get_extract_client("second-key", "https://example.com")
+        chat_client = get_openai_client("third-key", "https://example.com")
+
+        http_client = search_client.client._client
+        assert extract_client.client._client is http_client
+        assert chat_client._client is http_client
+        pool = http_client._transport._pool  # type: ignore[attr-defined]
+        assert pool._max_connections == 100
+        assert pool._max_keepalive_connections == 50
+
+
+class TestGetApiKey:
+    """Test cases for get_api_key."""
+
+    def test_explicit_key_takes_precedence(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test an explicit key wins over the environment."""
+        monkeypatch.setenv("PARALLEL_API_KEY", "env-key")
+        assert get_api_key("explicit-key") == "explicit-key"
+
+    def test_env_key_is_not_cached(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test environment changes are picked up between calls."""
+        monkeypatch.setenv("PARALLEL_API_KEY", "first-key")
+        assert get_api_key() == "first-key"
+        monkeypatch.setenv("PARALLEL_API_KEY", "second-key")
+        assert get_api_key() == "second-key"
+
+    def test_missing_key_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a missing key raises a helpful error."""
+        monkeypatch.delenv("PARALLEL_API_KEY", raising=False)
+        with pytest.raises(ValueError, match="PARALLEL_API_KEY"):
+            get_api_key()
+
+
+class TestBuildSearchKwargs:
+    """Test cases for the shared search payload builder."""
+
+    def test_omits_unset_optional_params(self) -> None:
+        """Test only provided optional params are sent to the SDK."""
+        kwargs = _build_search_kwargs(
+            objective="test",
+            search_queries=None,
+            max_results=5,
+            excerpts=None,
+            mode="agentic",
+            source_policy=None,
+            fetch_policy=None,
+            timeout=30.0,
+        )
+
+        assert kwargs == {
+            "objective": "test",
+            "search_queries": None,
+            "max_results": 5,
+            "timeout": 30.0,
+            "mode": "agentic",
+        }
+
+    def test_requires_objective_or_queries(self) -> None:
+        """Test a search without objective or queries is rejected."""
+        with pytest.raises(ValueError, match="must be provided"):
+            _build_search_kwargs(
+                objective=None,
+                search_queries=None,
+                max_results=10,
+                excerpts=None,
+                mode=None,
+                source_policy=None,
+                fetch_policy=None,
+                timeout=30.0,
+            )
+
+
+class TestResponseCache:
+    """Test cases for client-side response caching."""
+
+    def test_identical_searches_hit_cache(self) -> None:
+        """Test a repeated search is served from the cache."""
+        cache: dict = {}
+        requests: list[httpx.Request] = []
+        client = ParallelSearchClient(api_key="test-key", cache=cache)
+        client.client = _sdk_client(
+            _json_handler({"search_id": "search-123", "results": []}, requests)
+        )
+
+        first = client.search(objective="test", timeout=10.0)
+        first["search_metadata"] = {"annotated": True}
+        second = client.search(objective="test", timeout=20.0)
+
+        assert len(requests) == 1
+        assert len(cache) == 1
+        assert second == {"search_id": "search-123", "results": []}
+
+    def test_different_searches_miss_cache(self) -> None:
+        """Test searches with different arguments are cached separately."""
+        requests: list[httpx.Request] = []
+        client = ParallelSearchClient(api_key="test-key", cache={})
+        client.client = _sdk_client(_json_handler({}, requests))
+
+        client.search(objective="first")
+        client.search(objective="second")
+
+        assert len(requests) == 2
+
+    async def test_async_extract_hits_cache(self) -> None:
+        """Test a repeated async extract is served from the cache."""
+        requests: list[httpx.Request] = []
+        client = AsyncParallelExtractClient(api_key="test-key", cache={})
+        client.client = _async_sdk_client(_json_handler({"results": []}, requests))
+
+        await client.extract(urls=["https://example.com"])
+        result = await client.extract(urls=["https://example.com"])
+
+        assert result == {"results": []}
+        assert len(requests) == 1
+
+    def test_disable_cache_fallback_bypasses_cache(self) -> None:
+        """Test extracts that refuse stale content always reach the API."""
+        requests: list[httpx.Request] = []
+        client = ParallelExtractClient(api_key="test-key", cache={})
+        client.client = _sdk_client(_json_handler({"results": []}, requests))
+        fetch_policy = {"disable_cache_fallback": True}
+
+        client.extract(urls=["https://example.com"], fetch_policy=fetch_policy)
+        client.extract(urls=["https://example.com"], fetch_policy=fetch_policy)
+
+        assert len(requests) == 2
+        assert client.cache == {}
+
+
+class TestTTLCache:
+    """Test cases for the in-memory TTL response cache."""
+
+    def test_entries_expire(self) -> None:
+        """Test entries are dropped once their lifetime has passed."""
+        now = [0.0]
+        cache = TTLCache(ttl=10.0, timer=lambda: now[0])
+        cache["key"] = {"results": []}
+
+        now[0] = 9.0
+        assert cache.get("key") == {"results": []}
+        now[0] = 10.0
+        assert cache.get("key") is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_entry_evicted(self) -> None:
+        """Test the least recently used entry is evicted when full."""
+        cache = TTLCache(maxsize=2)
+        cache["a"] = {}
+        cache["b"] = {}
+        assert cache.get("a") == {}
+
+        cache["c"] = {}
+
+        assert list(cache) == ["a", "c"]
+
+    def test_ttl_read_from_environment(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the default lifetime can be set through the environment."""
+        monkeypatch.setenv("PARALLEL_CACHE_TTL", "42")
+        assert TTLCache().ttl == 42.0
+
+        monkeypatch.delenv("PARALLEL_CACHE_TTL")
+        assert TTLCache().ttl == 300.0
+
+    def test_search_served_from_ttl_cache(self) -> None:
+        """Test the search client accepts a TTL cache."""
+        requests: list[httpx.Request] = []
+        client = ParallelSearchClient(api_key="test-key", cache=TTLCache())
+        client.client = _sdk_client(_json_handler({"results": []}, requests))
+
+        client.search(objective="test")
+        client.search(objective="test")
+
+        assert len(requests) == 1
+
+
+class TestSearchTimeout:
+    """Test cases for search timeout selection."""
+
+    def test_timeout_looked_up_by_mode(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the default timeout comes from the per-mode table."""
+        monkeypatch.setitem(SEARCH_TIMEOUT_BY_MODE, "agentic", 5.0)
+
+        assert _get_search_timeout("agentic") == 5.0
+        assert _get_search_timeout("unknown-mode") == DEFAULT_SEARCH_TIMEOUT
+        assert _get_search_timeout(None) == DEFAULT_SEARCH_TIMEOUT
+
+    def test_explicit_timeout_wins(self) -> None:
+        """Test a per-call timeout overrides the mode default."""
+        kwargs = _build_search_kwargs(
+            objective="test",
+            search_queries=None,
+            max_results=10,
+            excerpts=None,
+            mode="agentic",
+            source_policy=None,
+            fetch_policy=None,
+            timeout=2.5,
+        )
+
+        assert kwargs["timeout"] == 2.5
+
+    def test_client_timeouts_override_module_defaults(self) -> None:
+        """Test per-client timeouts apply unless a call passes its own."""
+        requests: list[httpx.Request] = []
+        client = ParallelSearchClient(
+            "test-key",
+            client=_sdk_client(_json_handler({"results": []}, requests)),
+            default_timeout=3.0,
+            timeouts_by_mode={"agentic": 8.0},
+        )
+
+        assert client._get_search_timeout("one-shot") == 3.0
+        assert client._get_search_timeout("agentic") == 8.0
+
+        client.search(objective="test", mode="agentic")
+        client.search(objective="test", mode="agentic", timeout=1.5)
+
+        assert [request.extensions["timeout"]["read"] for request in requests] == [
+            8.0,
+            1.5,
+        ]
+
+
+class TestExtractTimeout:
+    """Test cases for extract timeout selection."""
+
+    def test_timeout_grows_with_urls_up_to_cap(self) -> None:
+        """Test the default timeout is linear in URLs but bounded."""
+        assert _get_extract_timeout(1) == 12.0
+        assert _get_extract_timeout(10) == 30.0
+        assert _get_extract_timeout(200) == 120.0
+
+    def test_default_applied_to_payload(self) -> None:
+        """Test the default timeout is used when none is given."""
+        kwargs = _build_extract_kwargs(
+            urls=["https://a.com", "https://b.com"],
+            objective=None,
+            search_queries=None,
+            excerpts=None,
+            full_content=None,
+            fetch_policy=None,
+            timeout=None,
+        )
+
+        assert kwargs["timeout"] == 14.0
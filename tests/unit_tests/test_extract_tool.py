@@ -1,9 +1,16 @@
 """Unit tests for Parallel Extract Tool."""
 
+import asyncio
+import json
+import threading
 from unittest.mock import AsyncMock, Mock, patch
 
+import httpx
 import pytest
+from parallel import APIConnectionError, APITimeoutError, AsyncParallel
 
+from langchain_parallel_web._client import TTLCache
+from langchain_parallel_web._types import ExcerptSettings, FetchPolicy, dump_settings
 from langchain_parallel_web.extract_tool import ParallelExtractTool
 
 
@@ -134,6 +141,33 @@ class TestParallelExtractTool:
             assert result[1]["error_type"] == "http_error"
             assert result[1]["http_status_code"] == 404
 
+    @patch("langchain_parallel_web.extract_tool.get_extract_client")
+    def test_extract_error_without_type(self, mock_get_extract_client: Mock) -> None:
+        """Test error content when error_type is missing or null."""
+        mock_client = Mock()
+        mock_client.extract.return_value = {
+            "results": [],
+            "errors": [
+                {"url": "https://example1.com"},
+                {"url": "https://example2.com", "error_type": None},
+            ],
+        }
+        mock_get_extract_client.return_value = mock_client
+
+        with patch(
+            "langchain_parallel_web.extract_tool.get_api_key", return_value="test-key"
+        ):
+            tool = ParallelExtractTool()
+            result = tool.invoke(
+                {"urls": ["https://example1.com", "https://example2.com"]}
+            )
+
+        assert [item["content"] for item in result] == [
+            "Error: Unknown error",
+            "Error: Unknown error",
+        ]
+        assert [item["error_type"] for item in result] == [None, None]
+
     @patch("langchain_parallel_web.extract_tool.get_extract_client")
     def test_extract_with_max_chars(self, mock_get_extract_client: Mock) -> None:
         """Test extraction with max_chars_per_extract limit."""
@@ -178,6 +212,53 @@ class TestParallelExtractTool:
             ):
                 tool.invoke({"urls": ["https://example.com"]})
 
+    @patch("langchain_parallel_web.extract_tool.get_extract_client")
+    def test_extract_propagates_network_errors(
+        self, mock_get_extract_client: Mock
+    ) -> None:
+        """Test timeouts and connection errors are raised unwrapped."""
+        request = httpx.Request("POST", "https://api.parallel.ai/v1beta/extract")
+        mock_client = Mock()
+        mock_client.extract.side_effect = APITimeoutError(request=request)
+        mock_get_extract_client.return_value = mock_client
+
+        with patch(
+            "langchain_parallel_web.extract_tool.get_api_key", return_value="test-key"
+        ):
+            tool = ParallelExtractTool()
+
+            with pytest.raises(APITimeoutError):
+                tool.invoke({"urls": ["https://example.com"]})
+
+            mock_client.extract.side_effect = httpx.ConnectError("refused")
+            with pytest.raises(httpx.ConnectError):
+                tool.invoke({"urls": ["https://example.com"]})
+
+    @patch("langchain_parallel_web.extract_tool.get_async_extract_client")
+    @pytest.mark.asyncio
+    async def test_async_extract_propagates_network_errors(
+        self, mock_get_async_extract_client: Mock
+    ) -> None:
+        """Test ainvoke raises timeouts and connection errors unwrapped."""
+        request = httpx.Request("POST", "https://api.parallel.ai/v1beta/extract")
+        mock_async_client = Mock()
+        mock_async_client.extract = AsyncMock(
+            side_effect=APIConnectionError(request=request)
+        )
+        mock_get_async_extract_client.return_value = mock_async_client
+
+        with patch(
+            "langchain_parallel_web.extract_tool.get_api_key", return_value="test-key"
+        ):
+            tool = ParallelExtractTool()
+
+        with pytest.raises(APIConnectionError):
+            await tool.ainvoke({"urls": ["https://example.com"]})
+
+        mock_async_client.extract.side_effect = httpx.ReadTimeout("slow")
+        with pytest.raises(httpx.ReadTimeout):
+            await tool.ainvoke({"urls": ["https://example.com"]})
+
     @patch("langchain_parallel_web.extract_tool.get_async_extract_client")
     @patch("langchain_parallel_web.extract_tool.get_extract_client")
     @pytest.mark.asyncio
@@ -262,3 +343,435 @@ class TestParallelExtractTool:
             result = tool.invoke({"urls": ["https://example.com"]})
 
             assert len(result) == 0
+
+    @patch("langchain_parallel_web.extract_tool.get_extract_client")
+    def test_extract_deduplicates_urls(self, mock_get_extract_client: Mock) -> None:
+        """Test duplicate URLs are fetched once and fanned back out."""
+        mock_client = Mock()
+        mock_client.extract.return_value = {
+            "extract_id": "extract-123",
+            "results": [
+                {
+                    "url": "https://example1.com",
+                    "title": "Article 1",
+                    "full_content": "Content 1",
+                },
+                {
+                    "url": "https://example2.com",
+                    "title": "Article 2",
+                    "full_content": "Content 2",
+                },
+            ],
+            "errors": [],
+        }
+        mock_get_extract_client.return_value = mock_client
+
+        with patch(
+            "langchain_parallel_web.extract_tool.get_api_key", return_value="test-key"
+        ):
+            tool = ParallelExtractTool()
+            result = tool.invoke(
+                {
+                    "urls": [
+                        "https://example1.com",
+                        "https://example2.com",
+                        "https://example1.com",
+                    ]
+                }
+            )
+
+            call_kwargs = mock_client.extract.call_args[1]
+            assert call_kwargs["urls"] == [
+                "https://example1.com",
+                "https://example2.com",
+            ]
+            assert [item["url"] for item in result] == [
+                "https://example1.com",
+                "https://example2.com",
+                "https://example1.com",
+            ]
+            assert result[2]["content"] == "Content 1"
+            assert result[0] is not result[2]
+
+    @patch("langchain_parallel_web.extract_tool.get_async_extract_client")
+    @pytest.mark.asyncio
+    async def test_async_extract_deduplicates_urls(
+        self, mock_get_async_extract_client: Mock
+    ) -> None:
+        """Test async calls fetch duplicate URLs once and fan them back out."""
+        mock_async_client = Mock()
+        mock_async_client.extract = AsyncMock(
+            return_value={
+                "results": [
+                    {"url": "https://example1.com", "full_content": "Content 1"},
+                    {"url": "https://example2.com", "full_content": "Content 2"},
+                ],
+                "errors": [],
+            }
+        )
+        mock_get_async_extract_client.return_value = mock_async_client
+
+        with patch(
+            "langchain_parallel_web.extract_tool.get_api_key", return_value="test-key"
+        ):
+            tool = ParallelExtractTool()
+        urls = ["https://example1.com", "https://example2.com", "https://example1.com"]
+        result = await tool.ainvoke({"urls": urls})
+
+        mock_async_client.extract.assert_awaited_once()
+        assert mock_async_client.extract.call_args.kwargs["urls"] == urls[:2]
+        assert [item["url"] for item in result] == urls
+        assert result[0] is not result[2]
+
+    @patch("langchain_parallel_web.extract_tool.get_extract_client")
+    def test_extract_results_follow_request_order(
+        self, mock_get_extract_client: Mock
+    ) -> None:
+        """Test results and errors are returned in the order URLs were given."""
+        mock_client = Mock()
+        mock_client.extract.return_value = {
+            "extract_id": "extract-123",
+            "results": [
+                {"url": "https://example3.com", "title": "Article 3"},
+                {"url": "https://example1.com", "title": "Article 1"},
+            ],
+            "errors": [
+                {"url": "https://example2.com", "error_type": "fetch_error"},
+            ],
+        }
+        mock_get_extract_client.return_value = mock_client
+
+        with patch(
+            "langchain_parallel_web.extract_tool.get_api_key", return_value="test-key"
+        ):
+            tool = ParallelExtractTool()
+            result = tool.invoke(
+                {
+                    "urls": [
+                        "https://example1.com",
+                        "https://example2.com",
+                        "https://example3.com",
+                    ]
+                }
+            )
+
+            assert [item["url"] for item in result] == [
+                "https://example1.com",
+                "https://example2.com",
+                "https://example3.com",
+            ]
+            assert result[1]["error_type"] == "fetch_error"
+
+    @patch("langchain_parallel_web.extract_tool.get_extract_client")
+    def test_api_key_resolved_once(self, mock_get_extract_client: Mock) -> None:
+        """Test the API key is resolved at construction, not per invocation."""
+        mock_client = Mock()
+        mock_client.extract.return_value = {"results": [], "errors": []}
+        mock_get_extract_client.return_value = mock_client
+
+        with patch(
+            "langchain_parallel_web.extract_tool.get_api_key", return_value="test-key"
+        ) as mock_get_api_key:
+            tool = ParallelExtractTool()
+            tool.invoke({"urls": ["https://example1.com"]})
+            tool.invoke({"urls": ["https://example2.com"]})
+
+            mock_get_api_key.assert_called_once()
+
+    @patch("langchain_parallel_web.extract_tool.get_async_extract_client")
+    @patch("langchain_parallel_web.extract_tool.get_extract_client")
+    def test_clients_built_lazily_once(
+        self, mock_get_extract_client: Mock, mock_get_async_extract_client: Mock
+    ) -> None:
+        """Test only the client in use is built, and only on first use."""
+        mock_get_extract_client.return_value.extract.return_value = {"results": []}
+
+        with patch(
+            "langchain_parallel_web.extract_tool.get_api_key", return_value="test-key"
+        ):
+            tool = ParallelExtractTool()
+        mock_get_extract_client.assert_not_called()
+
+        tool.invoke({"urls": ["https://example1.com"]})
+        tool.invoke({"urls": ["https://example2.com"]})
+
+        mock_get_extract_client.assert_called_once()
+        mock_get_async_extract_client.assert_not_called()
+
+    @patch("langchain_parallel_web.extract_tool.get_extract_client")
+    def test_iter_extract_yields_formatted_results(
+        self, mock_get_extract_client: Mock
+    ) -> None:
+        """Test iter_extract streams the same entries _run returns."""
+        mock_client = Mock()
+        mock_client.extract.return_value = {
+            "results": [
+                {"url": "https://example2.com", "excerpts": ["Content 2"]},
+                {"url": "https://example1.com", "excerpts": ["Content 1"]},
+            ],
+            "errors": [],
+        }
+        mock_get_extract_client.return_value = mock_client
+
+        with patch(
+            "langchain_parallel_web.extract_tool.get_api_key", return_value="test-key"
+        ):
+            tool = ParallelExtractTool()
+
+        urls = ["https://example1.com", "https://example2.com"]
+        results = tool.iter_extract(urls)
+        mock_client.extract.assert_not_called()
+
+        first = next(results)
+        assert first["url"] == "https://example1.com"
+        assert first["content"] == "Content 1"
+        assert [item["url"] for item in results] == ["https://example2.com"]
+        assert list(tool.iter_extract(urls)) == tool.invoke({"urls": urls})
+
+    @patch("langchain_parallel_web.extract_tool.get_extract_client")
+    def test_extract_splits_urls_into_batches(
+        self, mock_get_extract_client: Mock
+    ) -> None:
+        """Test long URL lists are extracted in sub-batches and merged."""
+
+        def extract(urls: list[str], **kwargs: object) -> dict:
+            return {
+                "results": [{"url": url, "excerpts": [url]} for url in urls],
+                "errors": [],
+            }
+
+        mock_client = Mock()
+        mock_client.extract.side_effect = extract
+        mock_get_extract_client.return_value = mock_client
+
+        with patch(
+            "langchain_parallel_web.extract_tool.get_api_key", return_value="test-key"
+        ):
+            tool = ParallelExtractTool(max_batch_size=2)
+
+        urls = [f"https://example{i}.com" for i in range(5)]
+        result = tool.invoke({"urls": urls})
+
+        batches = sorted(
+            call.kwargs["urls"] for call in mock_client.extract.call_args_list
+        )
+        assert batches == [urls[0:2], urls[2:4], urls[4:5]]
+        assert [item["url"] for item in result] == urls
+
+    @patch("langchain_parallel_web.extract_tool.get_extract_client")
+    def test_failed_batch_does_not_wait_for_other_batches(
+        self, mock_get_extract_client: Mock
+    ) -> None:
+        """Test a failing sub-batch raises without waiting for the rest."""
+        release = threading.Event()
+        finished = threading.Event()
+
+        def extract(urls: list[str], **kwargs: object) -> dict:
+            if urls == ["https://example0.com"]:
+                msg = "API Error"
+                raise RuntimeError(msg)
+            release.wait(timeout=5)
+            finished.set()
+            return {"results": [{"url": url} for url in urls], "errors": []}
+
+        mock_client = Mock()
+        mock_client.extract.side_effect = extract
+        mock_get_extract_client.return_value = mock_client
+
+        with patch(
+            "langchain_parallel_web.extract_tool.get_api_key", return_value="test-key"
+        ):
+            tool = ParallelExtractTool(max_batch_size=1, max_workers=2)
+
+        urls = [f"https://example{i}.com" for i in range(5)]
+        try:
+            with pytest.raises(RuntimeError, match="API Error"):
+                list(tool.iter_extract(urls))
+            # The slow batch is still running, and later ones never start
+            assert not finished.is_set()
+        finally:
+            release.set()
+        assert mock_client.extract.call_count <= 3
+
+    def test_extract_rejects_empty_urls(self) -> None:
+        """Test an empty URL list is rejected rather than sent in no batches."""
+        with patch(
+            "langchain_parallel_web.extract_tool.get_api_key", return_value="test-key"
+        ):
+            tool = ParallelExtractTool()
+
+        with pytest.raises(ValueError, match="At least one URL must be provided"):
+            tool.invoke({"urls": []})
+
+    @pytest.mark.asyncio
+    async def test_async_extract_rejects_empty_urls(self) -> None:
+        """Test ainvoke rejects an empty URL list like invoke does."""
+        with patch(
+            "langchain_parallel_web.extract_tool.get_api_key", return_value="test-key"
+        ):
+            tool = ParallelExtractTool()
+
+        with pytest.raises(ValueError, match="At least one URL must be provided"):
+            await tool.ainvoke({"urls": []})
+
+    @patch("langchain_parallel_web.extract_tool.get_async_extract_client")
+    @pytest.mark.asyncio
+    async def test_async_extract_splits_urls_into_batches(
+        self, mock_get_async_extract_client: Mock
+    ) -> None:
+        """Test async calls send sub-batches concurrently, capped by max_workers."""
+        in_flight = 0
+        peak = 0
+
+        async def extract(urls: list[str], **kwargs: object) -> dict:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {
+                "results": [{"url": url, "excerpts": [url]} for url in urls],
+                "errors": [],
+            }
+
+        mock_async_client = Mock()
+        mock_async_client.extract = AsyncMock(side_effect=extract)
+        mock_get_async_extract_client.return_value = mock_async_client
+
+        with patch(
+            "langchain_parallel_web.extract_tool.get_api_key", return_value="test-key"
+        ):
+            tool = ParallelExtractTool(max_batch_size=1, max_workers=2)
+
+        urls = [f"https://example{i}.com" for i in range(5)]
+        result = await tool.ainvoke({"urls": urls})
+
+        assert mock_async_client.extract.await_count == 5
+        assert peak == 2
+        assert [item["url"] for item in result] == urls
+
+    @patch("langchain_parallel_web.extract_tool.get_async_extract_client")
+    @patch("langchain_parallel_web.extract_tool.get_extract_client")
+    @pytest.mark.asyncio
+    async def test_async_client_and_key_reused_across_calls(
+        self, mock_get_extract_client: Mock, mock_get_async_extract_client: Mock
+    ) -> None:
+        """Test async runs reuse the resolved API key and one async client."""
+        mock_async_client = Mock()
+        mock_async_client.extract = AsyncMock(return_value={"results": []})
+        mock_get_async_extract_client.return_value = mock_async_client
+
+        with patch(
+            "langchain_parallel_web.extract_tool.get_api_key", return_value="test-key"
+        ) as mock_get_api_key:
+            tool = ParallelExtractTool()
+            await tool.ainvoke({"urls": ["https://example1.com"]})
+            await tool.ainvoke({"urls": ["https://example2.com"]})
+
+            mock_get_api_key.assert_called_once()
+
+        mock_get_async_extract_client.assert_called_once()
+        mock_get_extract_client.assert_not_called()
+
+    @patch("langchain_parallel_web.extract_tool.get_extract_client")
+    def test_extract_can_drop_raw_excerpts(self, mock_get_extract_client: Mock) -> None:
+        """Test keep_raw_excerpts=False returns excerpts only as content."""
+        mock_client = Mock()
+        mock_client.extract.return_value = {
+            "results": [{"url": "https://example.com", "excerpts": ["One", "Two"]}],
+            "errors": [],
+        }
+        mock_get_extract_client.return_value = mock_client
+
+        with patch(
+            "langchain_parallel_web.extract_tool.get_api_key", return_value="test-key"
+        ):
+            tool = ParallelExtractTool(keep_raw_excerpts=False)
+            result = tool.invoke({"urls": ["https://example.com"]})
+
+        assert result[0]["content"] == "One\n\nTwo"
+        assert "excerpts" not in result[0]
+
+    def test_cache_ttl_builds_ttl_cache(self) -> None:
+        """Test cache_ttl sets up an in-memory TTL cache when none is given."""
+        with patch(
+            "langchain_parallel_web.extract_tool.get_api_key", return_value="test-key"
+        ):
+            tool = ParallelExtractTool(cache_ttl=60)
+
+        assert isinstance(tool.cache, TTLCache)
+        assert tool.cache.ttl == 60
+
+    @pytest.mark.asyncio
+    async def test_concurrent_async_calls_batched(self) -> None:
+        """Test batch_window combines concurrent ainvoke calls into one request."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            urls = json.loads(request.content)["urls"]
+            results = [{"url": url, "full_content": url} for url in urls]
+            return httpx.Response(200, json={"results": results, "errors": []})
+
+        with patch(
+            "langchain_parallel_web.extract_tool.get_api_key", return_value="test-key"
+        ):
+            tool = ParallelExtractTool(batch_window=0.01)
+        tool._get_async_client().client = AsyncParallel(
+            api_key="test-key",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+
+        first, second = await asyncio.gather(
+            tool.ainvoke({"urls": ["https://example1.com"]}),
+            tool.ainvoke({"urls": ["https://example2.com"]}),
+        )
+
+        assert len(requests) == 1
+        assert [item["content"] for item in first] == ["https://example1.com"]
+        assert [item["content"] for item in second] == ["https://example2.com"]
+
+    @pytest.mark.asyncio
+    async def test_batched_calls_keep_normalized_urls(self) -> None:
+        """Test batching does not drop results returned under a normalized URL."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            urls = json.loads(request.content)["urls"]
+            results = [{"url": url.rstrip("/"), "full_content": url} for url in urls]
+            return httpx.Response(200, json={"results": results, "errors": []})
+
+        with patch(
+            "langchain_parallel_web.extract_tool.get_api_key", return_value="test-key"
+        ):
+            tool = ParallelExtractTool(batch_window=0.01)
+        tool._get_async_client().client = AsyncParallel(
+            api_key="test-key",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+
+        first, second = await asyncio.gather(
+            tool.ainvoke({"urls": ["https://a.com/"]}),
+            tool.ainvoke({"urls": ["https://b.com"]}),
+        )
+
+        assert [item["url"] for item in first] == ["https://a.com"]
+        assert [item["url"] for item in second] == ["https://b.com"]
+
+
+class TestDumpSettings:
+    """Test cases for settings serialization."""
+
+    def test_matches_model_dump(self) -> None:
+        """Test settings serialize like model_dump(exclude_none=True)."""
+        fetch_policy = FetchPolicy(max_age_seconds=86400)
+
+        assert dump_settings(fetch_policy) == fetch_policy.model_dump(exclude_none=True)
+        assert dump_settings(ExcerptSettings()) == {}
+
+    def test_raw_dict_used_as_is(self) -> None:
+        """Test settings passed as a dict skip model construction."""
+        params = {"max_age_seconds": 600, "timeout_seconds": None}
+
+        assert dump_settings(params) == {"max_age_seconds": 600}
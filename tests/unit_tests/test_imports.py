@@ -0,0 +1,35 @@
+"""Test the public package interface."""
+
+import subprocess
+import sys
+
+import langchain_parallel_web
+
+EXPECTED_ALL = [
+    "ChatParallelWeb",
+    "ExcerptSettings",
+    "FetchPolicy",
+    "FullContentSettings",
+    "ParallelExtractTool",
+    "ParallelWebSearchTool",
+    "TTLCache",
+    "__version__",
+]
+
+
+def test_all_imports() -> None:
+    """Test every name in __all__ resolves."""
+    assert sorted(EXPECTED_ALL) == sorted(langchain_parallel_web.__all__)
+    for name in EXPECTED_ALL:
+        assert getattr(langchain_parallel_web, name) is not None
+
+
+def test_tools_do_not_import_openai() -> None:
+    """Test importing a tool does not load the chat model's OpenAI SDK."""
+    code = (
+        "import sys\n"
+        "from langchain_parallel_web import ParallelExtractTool\n"
+        "assert 'openai' not in sys.modules\n"
+        "assert 'langchain_parallel_web.chat_models' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
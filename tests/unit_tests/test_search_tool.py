@@ -109,3 +109,34 @@ class TestParallelWebSearchTool:
 
             assert result["search_id"] == "async-test-123"
             assert len(result["results"]) == 1
+
+    @patch("langchain_parallel_web.search_tool.get_async_search_client")
+    @patch("langchain_parallel_web.search_tool.get_search_client")
+    def test_cache_passed_to_clients(
+        self, mock_get_client: Mock, mock_get_async_client: Mock
+    ) -> None:
+        """Test the tool shares its response cache with both clients."""
+        cache: dict = {}
+
+        with patch(
+            "langchain_parallel_web.search_tool.get_api_key", return_value="test-key"
+        ):
+            tool = ParallelWebSearchTool(cache=cache)
+
+        assert tool.cache is cache
+        assert mock_get_client.call_args.kwargs["cache"] is cache
+        assert mock_get_async_client.call_args.kwargs["cache"] is cache
+
+    @patch("langchain_parallel_web.search_tool.get_async_search_client")
+    @patch("langchain_parallel_web.search_tool.get_search_client")
+    def test_max_retries_passed_to_clients(
+        self, mock_get_client: Mock, mock_get_async_client: Mock
+    ) -> None:
+        """Test the tool's retry budget is applied to both clients."""
+        with patch(
+            "langchain_parallel_web.search_tool.get_api_key", return_value="test-key"
+        ):
+            ParallelWebSearchTool(max_retries=5)
+
+        assert mock_get_client.call_args.kwargs["max_retries"] == 5
+        assert mock_get_async_client.call_args.kwargs["max_retries"] == 5